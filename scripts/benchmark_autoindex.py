@@ -0,0 +1,184 @@
+"""
+Benchmark of the parsing of download.blender.org listings.
+
+The /release/ index and the listing of a release folder are parsed the original way, with
+BeautifulSoup and lxml, and the current way, with parse_autoindex over chunks of the size the
+scraper streams. Both must return exactly the same links and dates, and for the files of a
+release folder the same sizes, for the link filters of every platform. The time taken by both is
+reported per listing.
+
+The listings in scripts/fixtures, laid out like the nginx listings of download.blender.org, are
+used, or those recorded by `benchmark_scraper.py record`. The original parser read the dates of
+the release folders as local time, so the comparison runs in UTC, where both agree.
+
+The original parser needs BeautifulSoup, which the launcher no longer depends on:
+    pip install beautifulsoup4 lxml
+
+Usage (from the repository root):
+    python scripts/benchmark_autoindex.py --runs 20
+    python scripts/benchmark_autoindex.py bench_fixtures --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+RELEASE_INDEX = "/release/"
+
+# The link filters of Scraper.__init__, per platform
+PLATFORM_LINKS = {
+    "Windows": re.compile(r"blender-.+win.+64.+zip$", re.IGNORECASE),
+    "macOS": re.compile(r"blender-.+(macOS|darwin).+dmg$", re.IGNORECASE),
+    "Linux": re.compile(r"blender-.+lin.+64.+tar+(?!.*sha256).*", re.IGNORECASE),
+}
+RELEASE_LINK = re.compile(r"Blender\d+\.\d+")
+
+
+def saved_listings() -> list[tuple[str, bytes]]:
+    return [
+        (RELEASE_INDEX, (FIXTURES / "release.html").read_bytes()),
+        ("/release/Blender4.1/", (FIXTURES / "Blender4.1.html").read_bytes()),
+    ]
+
+
+def recorded_listings(fixtures: Path) -> list[tuple[str, bytes]]:
+    index = json.loads((fixtures / "index.json").read_text(encoding="utf-8"))
+    listings = []
+    for key, entry in sorted(index.items()):
+        method, url = key.split(" ", 1)
+        parts = urlsplit(url)
+        if method == "GET" and parts.netloc == "download.blender.org" and parts.path.startswith(RELEASE_INDEX):
+            listings.append((parts.path, (fixtures / entry["body"]).read_bytes()))
+    return listings
+
+
+def original_release_index(content: bytes) -> list[tuple]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "lxml")
+    releases = soup.find_all(href=RELEASE_LINK)
+
+    folders = []
+    for release in releases:
+        modified_date = None
+        date_sibling = release.find_next_sibling(string=True)
+        if date_sibling:
+            date_str = " ".join(date_sibling.strip().split()[:2])
+            with contextlib.suppress(ValueError):
+                modified_date = datetime.strptime(date_str, "%d-%b-%Y %H:%M").astimezone(tz=timezone.utc)
+        folders.append((release["href"], modified_date))
+    return folders
+
+
+def original_release_folder(content: bytes, link: re.Pattern) -> list[tuple]:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(content, "lxml")
+    files = []
+    for tag in soup.find_all("a", href=link):
+        modified_date, size = None, None
+        sibling = tag.next_sibling
+        fields = sibling.split() if isinstance(sibling, str) else []
+        if len(fields) >= 2:
+            try:
+                modified_date = datetime.strptime(f"{fields[0]} {fields[1]}", "%d-%b-%Y %H:%M").replace(
+                    tzinfo=timezone.utc
+                )
+            except ValueError:
+                pass
+            else:
+                if len(fields) > 2 and fields[2].isdigit():
+                    size = int(fields[2])
+        files.append((tag["href"], modified_date, size))
+    return files
+
+
+def chunked(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+def best_time(parse, runs: int) -> tuple[float, list]:
+    best = float("inf")
+    result = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = parse()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("fixtures", type=Path, nargs="?", help="Folder recorded by benchmark_scraper.py")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    if importlib.util.find_spec("bs4") is None or importlib.util.find_spec("lxml") is None:
+        sys.exit("The original parser needs BeautifulSoup: pip install beautifulsoup4 lxml")
+
+    os.environ["TZ"] = "UTC"
+    if hasattr(time, "tzset"):
+        time.tzset()
+
+    from modules.autoindex import parse_autoindex
+    from threads.scraper import LISTING_CHUNK_SIZE
+
+    if args.fixtures is not None:
+        listings = recorded_listings(args.fixtures)
+        if not listings:
+            sys.exit(f"No download.blender.org listings recorded in {args.fixtures}")
+    else:
+        listings = saved_listings()
+
+    def current(body: bytes, link: re.Pattern) -> list:
+        return [entry for entry in parse_autoindex(chunked(body, LISTING_CHUNK_SIZE)) if link.search(entry.href)]
+
+    mismatches = 0
+    print(f"best of {args.runs} runs, {LISTING_CHUNK_SIZE // 1024} KiB chunks")
+    print(f"{'listing':<28} {'filter':<8} {'links':>6} {'soup (ms)':>10} {'stream (ms)':>12}")
+    for name, body in listings:
+        if name == RELEASE_INDEX:
+            checks = [("release", RELEASE_LINK, lambda body=body: original_release_index(body))]
+        else:
+            checks = [
+                (platform, link, lambda body=body, link=link: original_release_folder(body, link))
+                for platform, link in PLATFORM_LINKS.items()
+            ]
+
+        for label, link, original in checks:
+            before, expected = best_time(original, args.runs)
+            after, entries = best_time(lambda body=body, link=link: current(body, link), args.runs)
+
+            if name == RELEASE_INDEX:
+                result = [(entry.href, entry.date) for entry in entries]
+            else:
+                result = [(entry.href, entry.date, entry.size) for entry in entries]
+
+            if result != expected:
+                mismatches += 1
+                print(f"MISMATCH {name} {label}:")
+                for row in sorted(set(expected) ^ set(result), key=str):
+                    print(f"    {'original' if row in expected else 'current '} {row}")
+
+            print(f"{name:<28} {label:<8} {len(expected):>6} {before * 1000:>10.2f} {after * 1000:>12.2f}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
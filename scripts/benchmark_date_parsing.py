@@ -0,0 +1,110 @@
+"""
+Benchmark of the date parsers.
+
+Random HTTP, autoindex, `blender -v` and old .blinfo dates are parsed by the parsers of
+modules.date_parsing and by the `strptime` calls they replaced, which must give the same
+datetimes. The time taken by both is reported per format.
+
+`strptime` is run in the C locale, the only one in which its English month names always work.
+
+Usage (from the repository root):
+    python scripts/benchmark_date_parsing.py --dates 20000 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from locale import LC_ALL, setlocale
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+DAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+
+def random_dates(n: int, rng: random.Random) -> list[datetime]:
+    start = datetime(1995, 1, 1, tzinfo=timezone.utc)
+    return [start + timedelta(seconds=rng.randrange(40 * 365 * 24 * 3600)) for _ in range(n)]
+
+
+def formats():
+    from modules.date_parsing import parse_autoindex_date, parse_blinfo_date, parse_commit_date, parse_http_date
+
+    def http(dt: datetime) -> str:
+        return f"{DAYS[dt.weekday()]}, {dt.day:02} {MONTHS[dt.month - 1]} {dt.year} {dt:%H:%M:%S} GMT"
+
+    def nginx(dt: datetime) -> str:
+        return f"{dt.day:02}-{MONTHS[dt.month - 1]}-{dt.year} {dt:%H:%M}"
+
+    def blinfo(dt: datetime) -> str:
+        return f"{dt.day:02}-{MONTHS[dt.month - 1]}-{dt.year % 100:02}-{dt:%H:%M}"
+
+    def apache_strptime(s: str) -> datetime:
+        fmt = "%Y-%m-%d %H:%M" if s[4] == "-" else "%d-%b-%Y %H:%M"
+        return datetime.strptime(s, fmt).replace(tzinfo=timezone.utc)
+
+    # name, formatter, parser, the strptime call it replaced
+    return (
+        (
+            "http",
+            http,
+            parse_http_date,
+            lambda s: datetime.strptime(s, "%a, %d %b %Y %H:%M:%S %Z").replace(tzinfo=timezone.utc),
+        ),
+        ("nginx", nginx, parse_autoindex_date, apache_strptime),
+        ("apache", lambda dt: f"{dt:%Y-%m-%d %H:%M}", parse_autoindex_date, apache_strptime),
+        (
+            "commit",
+            lambda dt: (f"{dt:%Y-%m-%d}", f"{dt:%H:%M}"),
+            lambda s: parse_commit_date(*s),
+            lambda s: datetime.strptime(f"{s[0]} {s[1]}", "%Y-%m-%d %H:%M").astimezone(),
+        ),
+        ("blinfo", blinfo, parse_blinfo_date, lambda s: datetime.strptime(s, "%d-%b-%y-%H:%M").astimezone()),
+    )
+
+
+def timed(parse, samples, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        for s in samples:
+            parse(s)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dates", type=int, default=20000, help="Dates per format")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    setlocale(LC_ALL, "C")
+    dates = random_dates(args.dates, random.Random(args.seed))
+
+    mismatches = 0
+    print(f"{args.dates} dates per format, best of {args.runs} runs")
+    print(f"{'format':<8} {'strptime (us)':>14} {'parser (us)':>12} {'speedup':>8}")
+    for name, fmt, parse, reference in formats():
+        samples = [fmt(dt) for dt in dates]
+        for s in samples:
+            if parse(s) != reference(s):
+                mismatches += 1
+                print(f"MISMATCH {name} {s!r}: expected {reference(s)!r}, got {parse(s)!r}")
+
+        before = timed(reference, samples, args.runs) / len(samples)
+        after = timed(parse, samples, args.runs) / len(samples)
+        print(f"{name:<8} {before * 1e6:>14.2f} {after * 1e6:>12.2f} {before / after:>7.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
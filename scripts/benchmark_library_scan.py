@@ -0,0 +1,181 @@
+"""
+Benchmark of the library discovery of DrawLibraryTask.
+
+A synthetic library is created in a temporary folder, with builds spread over the four branch
+folders (most with a .blinfo, some with only an executable, some unrecognized). It is then
+scanned by the original discovery (Path.iterdir and two is_file per build, one branch folder
+after the other) and by the current one (os.scandir, branch folders read concurrently). Both
+must find the same builds.
+
+The mount latency is simulated by sleeping in every directory listing, stat and directory
+entry stat call, since mounting a real network share needs privileges this script doesn't
+assume.
+
+Usage (from the repository root):
+    python scripts/benchmark_library_scan.py --builds 2000 --latency 0.0005 --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+FOLDERS = ("stable", "daily", "experimental", "custom")
+
+
+def make_library(root: Path, n_builds: int, blender_exe: str):
+    for i in range(n_builds):
+        build = root / FOLDERS[i % len(FOLDERS)] / f"blender-4.{i % 10}.{i}-linux-x64"
+        build.mkdir(parents=True)
+        if i % 10 == 9:
+            continue  # unrecognized
+        if i % 10 == 8:
+            exe = build / blender_exe
+            exe.parent.mkdir(parents=True, exist_ok=True)
+            exe.touch()
+        else:
+            (build / ".blinfo").write_text("{}", encoding="utf-8")
+
+
+def original_scan(library_folder: Path, blender_exe: str):
+    found, unrecognized = [], []
+    for folder in FOLDERS:
+        path = library_folder / folder
+
+        if path.is_dir():
+            for build in path.iterdir():
+                if build.is_dir():
+                    if (folder / build / ".blinfo").is_file() or (path / build / blender_exe).is_file():
+                        found.append(folder / build)
+                    else:
+                        unrecognized.append(folder / build)
+    return found, unrecognized
+
+
+def current_scan(library_folder: Path, blender_exe: str):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from threads.library_drawer import scan_folder
+
+    found, unrecognized = [], []
+    with ThreadPoolExecutor(max_workers=len(FOLDERS)) as executor:
+        scans = [executor.submit(scan_folder, library_folder / folder, folder, {}, blender_exe) for folder in FOLDERS]
+        for scan in scans:
+            result = scan.result()
+            found += [path for path, _ in result.found]
+            unrecognized += result.unrecognized
+    return found, unrecognized
+
+
+class SlowEntry:
+    def __init__(self, entry: os.DirEntry, latency: float):
+        self._entry = entry
+        self._latency = latency
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self):
+        # Answered from the directory listing itself
+        return self._entry.is_dir()
+
+    def stat(self):
+        time.sleep(self._latency)
+        return self._entry.stat()
+
+
+class SlowScandir:
+    def __init__(self, it, latency: float):
+        self._it = it
+        self._latency = latency
+
+    def __iter__(self):
+        return (SlowEntry(entry, self._latency) for entry in self._it)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self._it.close()
+
+
+@contextmanager
+def injected_latency(latency: float):
+    """Sleeps `latency` seconds in every file system call the scans make, like a network mount would."""
+    if not latency:
+        yield
+        return
+
+    stat, listdir, scandir = os.stat, os.listdir, os.scandir
+
+    def slow_stat(*args, **kwargs):
+        time.sleep(latency)
+        return stat(*args, **kwargs)
+
+    def slow_listdir(*args, **kwargs):
+        time.sleep(latency)
+        return listdir(*args, **kwargs)
+
+    def slow_scandir(*args, **kwargs):
+        time.sleep(latency)
+        return SlowScandir(scandir(*args, **kwargs), latency)
+
+    os.stat, os.listdir, os.scandir = slow_stat, slow_listdir, slow_scandir
+    try:
+        yield
+    finally:
+        os.stat, os.listdir, os.scandir = stat, listdir, scandir
+
+
+def timed(scan, library_folder: Path, blender_exe: str, runs: int):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = scan(library_folder, blender_exe)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--builds", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.0005, help="Seconds added to every call on the mount")
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    from threads.library_drawer import blender_exe_name
+
+    blender_exe = blender_exe_name()
+    mismatches = 0
+    with tempfile.TemporaryDirectory(prefix="bl-benchmark-") as root:
+        library_folder = Path(root)
+        make_library(library_folder, args.builds, blender_exe)
+
+        print(f"{args.builds} builds, best of {args.runs} runs")
+        print(f"{'mount':<22} {'original (ms)':>14} {'current (ms)':>13} {'speedup':>8}")
+        for name, latency in (("local disk", 0.0), (f"{latency_label(args.latency)} latency", args.latency)):
+            with injected_latency(latency):
+                before, expected = timed(original_scan, library_folder, blender_exe, args.runs)
+                after, actual = timed(current_scan, library_folder, blender_exe, args.runs)
+
+            if tuple(sorted(map(str, e)) for e in expected) != tuple(sorted(map(str, a)) for a in actual):
+                mismatches += 1
+                print(f"MISMATCH on {name}")
+            print(f"{name:<22} {before * 1000:>14.1f} {after * 1000:>13.1f} {before / after:>7.1f}x")
+
+    sys.exit(1 if mismatches else 0)
+
+
+def latency_label(latency: float) -> str:
+    return f"{latency * 1000:g} ms"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark of the idle cost of watching the library.
+
+A synthetic library is watched, untouched, for the given number of seconds by the original
+FolderObserver loop (iterdir of a folder every 3 seconds), by the current FolderObserver with
+inotify and by its polling fallback. The wakeups (voluntary context switches) and the CPU time
+of the watching thread are read from /proc, so this only runs on Linux.
+
+Usage (from the repository root):
+    python scripts/benchmark_library_watcher.py --builds 2000 --seconds 60
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+FOLDERS = ("stable", "daily", "experimental", "custom")
+
+
+def make_library(root: Path, n_builds: int):
+    for i in range(n_builds):
+        build = root / FOLDERS[i % len(FOLDERS)] / f"blender-4.{i % 10}.{i}-linux-x64"
+        build.mkdir(parents=True)
+        (build / ".blinfo").write_text("{}", encoding="utf-8")
+
+
+def thread_stats(tid: int) -> tuple[int, float]:
+    """Voluntary context switches and CPU seconds of a thread of this process"""
+    task = Path(f"/proc/self/task/{tid}")
+    switches = 0
+    for line in (task / "status").read_text().splitlines():
+        if line.startswith("voluntary_ctxt_switches"):
+            switches = int(line.split()[1])
+
+    fields = (task / "stat").read_text().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    return switches, cpu
+
+
+def original_observer(library_folder: Path, stop: threading.Event):
+    # The original loop watched a single folder, it is run on every branch folder here
+    def get_subfolders():
+        return [sub.name for folder in FOLDERS for sub in (library_folder / folder).iterdir() if sub.is_dir()]
+
+    subfolders = get_subfolders()
+    while not stop.is_set():
+        new_subfolders = get_subfolders()
+        if subfolders != new_subfolders:
+            subfolders = new_subfolders
+        time.sleep(3)
+
+
+def measure(name: str, target, seconds: float):
+    ready = threading.Event()
+    tid = 0
+
+    def run():
+        nonlocal tid
+        tid = threading.get_native_id()
+        ready.set()
+        target()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    ready.wait()
+    # Let it finish setting up before measuring
+    time.sleep(1)
+
+    switches_before, cpu_before = thread_stats(tid)
+    time.sleep(seconds)
+    switches_after, cpu_after = thread_stats(tid)
+
+    wakeups = switches_after - switches_before
+    print(f"{name:<18} {wakeups:>8} {wakeups / seconds:>10.2f} {(cpu_after - cpu_before) * 1000:>9.0f}")
+    return thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--builds", type=int, default=2000)
+    parser.add_argument("--seconds", type=float, default=60)
+    args = parser.parse_args()
+
+    if not sys.platform.startswith("linux"):
+        sys.exit("Thread statistics are read from /proc, run this on Linux")
+
+    from threads.folder_observer import FolderObserver
+
+    with tempfile.TemporaryDirectory(prefix="bl-benchmark-") as root:
+        library_folder = Path(root)
+        make_library(library_folder, args.builds)
+
+        print(f"{args.builds} builds, idle for {args.seconds:g}s")
+        print(f"{'observer':<18} {'wakeups':>8} {'wakeups/s':>10} {'CPU (ms)':>9}")
+
+        stop = threading.Event()
+        thread = measure("original (3s)", lambda: original_observer(library_folder, stop), args.seconds)
+        stop.set()
+
+        observer = FolderObserver(library_folder)
+        thread = measure("inotify", observer.run, args.seconds)
+        observer.stop()
+        thread.join()
+
+        observer = FolderObserver(library_folder)
+        thread = measure("polling fallback", observer.poll, args.seconds)
+        observer.stop()
+        thread.join()
+
+
+if __name__ == "__main__":
+    main()
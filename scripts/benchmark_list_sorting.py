@@ -0,0 +1,156 @@
+"""
+Benchmark of the sorting of build lists.
+
+A list of synthetic builds is filled once with the original items (which look the build
+information up through their row widget and compare semver versions on every comparison)
+and once with the current ones (which compare precomputed keys), then sorted by version
+and by date. Both must give the same order.
+
+Usage (from the repository root):
+    QT_QPA_PLATFORM=offscreen python scripts/benchmark_list_sorting.py --rows 5000 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+
+def make_builds(n: int, rng: random.Random):
+    from modules.build_info import BuildInfo
+
+    prereleases = ("", "-alpha", "-beta", "-rc", " LTS")
+    date = datetime(2024, 3, 26, 10, 57, tzinfo=timezone.utc)
+    builds = []
+    for i in range(n):
+        subversion = f"{rng.randint(2, 4)}.{rng.randint(0, 9)}.{rng.randint(0, 20)}{rng.choice(prereleases)}"
+        commit_time = date - timedelta(minutes=rng.randint(0, 500_000))
+        if rng.random() < 0.1:
+            commit_time = commit_time.replace(tzinfo=None)
+        builds.append(BuildInfo(f"/library/daily/build-{i}", subversion, f"{i:012x}", commit_time, "daily"))
+    return builds
+
+
+def original_item_class():
+    from PyQt5.QtWidgets import QListWidgetItem
+
+    class OriginalItem(QListWidgetItem):
+        def __init__(self, date=None):
+            super().__init__()
+            self.date = date
+
+        def __lt__(self, other):
+            soring_type = self.listWidget().parent.sorting_type
+
+            if soring_type.name == "DATETIME":
+                return self.compare_datetime(other)
+            if soring_type.name == "VERSION":
+                return self.compare_version(other)
+            return False
+
+        def compare_datetime(self, other):
+            if (self.date is None) or (other.date is None):
+                return False
+
+            if self.date.tzinfo is None or other.date.tzinfo is None:
+                self.date = self.date.replace(tzinfo=timezone.utc)
+                other.date = other.date.replace(tzinfo=timezone.utc)
+
+            return self.date > other.date
+
+        def compare_version(self, other):
+            list_widget = self.listWidget()
+            this_widget = list_widget.itemWidget(self)
+            other_widget = list_widget.itemWidget(other)
+            if this_widget is None or other_widget is None:
+                return False
+
+            this_version = this_widget.build_info.semversion
+            other_version = other_widget.build_info.semversion
+            if this_version == other_version:
+                return self.compare_datetime(other)
+            return this_version > other_version
+
+    return OriginalItem
+
+
+def fill(list_widget, builds, make_item):
+    from PyQt5.QtWidgets import QWidget
+
+    list_widget.setSortingEnabled(False)
+    list_widget.clear()
+    for build_info in builds:
+        item = make_item(build_info)
+        widget = QWidget()
+        widget.build_info = build_info
+        list_widget.addItem(item)
+        list_widget.setItemWidget(item, widget)
+
+
+def sort(list_widget, sorting_type) -> tuple[float, list[str]]:
+    list_widget.parent.sorting_type = sorting_type
+    start = time.perf_counter()
+    list_widget.sortItems()
+    elapsed = time.perf_counter() - start
+    order = [list_widget.itemWidget(list_widget.item(row)).build_info.link for row in range(list_widget.count())]
+    return elapsed, order
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from items.base_list_widget_item import BaseListWidgetItem
+    from PyQt5.QtWidgets import QApplication, QListWidget
+    from widgets.base_page_widget import SortingType
+
+    _app = QApplication(sys.argv[:1])
+    builds = make_builds(args.rows, random.Random(args.seed))
+    original_item = original_item_class()
+    implementations = (
+        ("original", lambda build_info: original_item(build_info.commit_time)),
+        ("current", BaseListWidgetItem),
+    )
+
+    list_widget = QListWidget()
+    list_widget.parent = SimpleNamespace(sorting_type=SortingType.DATETIME)
+
+    print(f"{args.rows} rows, best of {args.runs} runs")
+    print(f"{'items':<10} {'by version (ms)':>16} {'by date (ms)':>13}")
+    orders = {}
+    for name, make_item in implementations:
+        best = {}
+        for sorting_type in (SortingType.VERSION, SortingType.DATETIME):
+            best[sorting_type] = float("inf")
+            for _ in range(args.runs):
+                fill(list_widget, builds, make_item)
+                elapsed, order = sort(list_widget, sorting_type)
+                best[sorting_type] = min(best[sorting_type], elapsed)
+            orders[name, sorting_type] = order
+        print(
+            f"{name:<10} {best[SortingType.VERSION] * 1000:>16.1f} {best[SortingType.DATETIME] * 1000:>13.1f}"
+        )
+
+    mismatches = [
+        sorting_type.name
+        for sorting_type in (SortingType.VERSION, SortingType.DATETIME)
+        if orders["original", sorting_type] != orders["current", sorting_type]
+    ]
+    if mismatches:
+        print(f"Different order when sorting by {', '.join(mismatches)}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
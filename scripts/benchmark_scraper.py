@@ -0,0 +1,306 @@
+"""
+Offline benchmark of the build scraper.
+
+Responses of download.blender.org, builder.blender.org and the GitHub API are recorded once,
+then replayed by a local http.server stand-in, optionally with injected latency and a bandwidth
+limit. Scraper.get_download_links is driven end-to-end through the real ConnectionManager, with
+the requests redirected to the local server, for both a cold and a warm cache.
+
+Usage (from the repository root):
+    python scripts/benchmark_scraper.py record bench_fixtures
+    python scripts/benchmark_scraper.py run bench_fixtures --latency 0.05 --bandwidth 2000000 --runs 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from pathlib import Path
+from urllib.parse import urlsplit
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+
+# Headers that no longer describe a body once urllib3 decoded it
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+def isolate_environment(root: Path):
+    """
+    Points the launcher's config and cache folders, and its portable settings file, into `root` so the
+    user's ones are left alone. The path helpers are replaced before anything imports them, on every
+    platform, as macOS ignores the environment variables they read elsewhere.
+    """
+    sys.path.insert(0, str(SOURCE))
+    # The launcher finds its certificates relative to the working directory
+    os.chdir(SOURCE.parent)
+
+    from modules import _platform
+
+    config_path = root / "config"
+    cache_path = root / "cache"
+    config_path.mkdir()
+    cache_path.mkdir()
+    _platform.get_config_path = lambda: str(config_path)
+    _platform.get_cache_path = lambda: str(cache_path)
+    _platform.local_config = lambda: config_path / "Blender Launcher.ini"
+    _platform.user_config = lambda: config_path / "Blender Launcher.ini"
+
+
+class Fixtures:
+    def __init__(self, path: Path):
+        self.path = path
+        self.index_path = path / "index.json"
+        self.lock = threading.Lock()
+        self.entries: dict[str, dict] = {}
+        if self.index_path.is_file():
+            self.entries = json.loads(self.index_path.read_text(encoding="utf-8"))
+
+    def add(self, method: str, url: str, final_url: str, status: int, headers: dict, body: bytes):
+        name = hashlib.sha256(f"{method} {url}".encode()).hexdigest()
+        with self.lock:
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / name).write_bytes(body)
+            self.entries[f"{method} {url}"] = {
+                "url": final_url,
+                "status": status,
+                "headers": {k: v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+                "body": name,
+            }
+
+    def get(self, method: str, url: str) -> tuple[dict, bytes] | None:
+        entry = self.entries.get(f"{method} {url}")
+        if entry is None and method == "HEAD":
+            entry = self.entries.get(f"GET {url}")
+        if entry is None:
+            return None
+        return entry, (self.path / entry["body"]).read_bytes()
+
+    def save(self):
+        self.index_path.write_text(json.dumps(self.entries, indent=1), encoding="utf-8")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, fixtures: Fixtures, latency: float, bandwidth: float | None):
+        super().__init__(("127.0.0.1", 0), FixtureHandler)
+        self.fixtures = fixtures
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.stats_lock = threading.Lock()
+        self.reset_stats()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def reset_stats(self):
+        with self.stats_lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.bytes_sent = 0
+
+    def local_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        query = f"?{parts.query}" if parts.query else ""
+        return f"{self.base_url}/{parts.netloc}{parts.path}{query}"
+
+    @staticmethod
+    def original_url(path: str) -> str:
+        return f"https://{path.lstrip('/')}"
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: FixtureServer
+
+    def do_GET(self):
+        self.reply(send_body=True)
+
+    def do_HEAD(self):
+        self.reply(send_body=False)
+
+    def reply(self, send_body: bool):
+        server = self.server
+        time.sleep(server.latency)
+        url = server.original_url(self.path)
+        fixture = server.fixtures.get(self.command, url)
+
+        with server.stats_lock:
+            server.requests += 1
+
+        if fixture is None:
+            self.send_response(404)
+            self.send_header("content-length", "0")
+            self.end_headers()
+            return
+
+        entry, body = fixture
+        if entry["url"] != url:
+            self.send_response(302)
+            self.send_header("location", server.local_url(entry["url"]))
+            self.send_header("content-length", "0")
+            self.end_headers()
+            return
+
+        headers = {k.lower(): v for k, v in entry["headers"].items()}
+        etag = headers.get("etag")
+        if etag is not None and self.headers.get("if-none-match") == etag:
+            with server.stats_lock:
+                server.not_modified += 1
+            self.send_response(304)
+            self.send_header("etag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(entry["status"])
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+
+        if not send_body:
+            return
+
+        chunk_size = 16 * 1024
+        for start in range(0, len(body), chunk_size):
+            chunk = body[start : start + chunk_size]
+            if server.bandwidth:
+                time.sleep(len(chunk) / server.bandwidth)
+            self.wfile.write(chunk)
+
+        with server.stats_lock:
+            server.bytes_sent += len(body)
+
+    def log_message(self, format, *args):  # noqa: A002
+        pass
+
+
+def make_connection_manager(rewrite=None, fixtures: Fixtures | None = None):
+    from modules.connection_manager import ConnectionManager
+    from semver import Version
+    from urllib3 import HTTPResponse
+
+    class BenchmarkConnectionManager(ConnectionManager):
+        def request(self, _method, _url, fields=None, headers=None, cache=False, **urlopen_kw):
+            if rewrite is not None:
+                return super().request(_method, rewrite(_url), fields, headers, cache, **urlopen_kw)
+
+            # Recording: always fetch the full response and keep a copy of it
+            r = super().request(_method, _url, fields, headers, False, **urlopen_kw)
+            if r is None:
+                return None
+
+            body = r.data or b""
+            final_url = r.geturl() or _url
+            assert fixtures is not None
+            fixtures.add(_method, _url, final_url, r.status, dict(r.headers), body)
+            if final_url != _url:
+                # Redirected, the replayed redirect has to land somewhere too
+                fixtures.add(_method, final_url, final_url, r.status, dict(r.headers), body)
+            return HTTPResponse(
+                body=BytesIO(body),
+                headers={k: v for k, v in r.headers.items() if k.lower() not in DROPPED_HEADERS},
+                status=r.status,
+                preload_content=urlopen_kw.get("preload_content", True),
+                decode_content=False,
+                request_method=_method,
+                request_url=r.geturl() or _url,
+            )
+
+    manager = BenchmarkConnectionManager(version=Version(0, 0, 0, build="benchmark"), proxy_type=0)
+    manager.setup()
+    return manager
+
+
+def make_scraper(manager):
+    from threads.scraper import Scraper
+
+    scraper = Scraper(None, manager)
+    builds = []
+    scraper.links.connect(builds.extend)
+    return scraper, builds
+
+
+def record(args, root: Path):
+    fixtures = Fixtures(args.fixtures)
+    manager = make_connection_manager(fixtures=fixtures)
+    scraper, builds = make_scraper(manager)
+    scraper.get_download_links(check_launcher_version=True)
+    fixtures.save()
+    print(f"Recorded {len(fixtures.entries)} responses ({len(builds)} builds) to {args.fixtures}")
+
+
+def run(args, root: Path):
+    from modules._platform import get_cache_path
+
+    server = FixtureServer(Fixtures(args.fixtures), args.latency, args.bandwidth)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    cache_path = Path(get_cache_path())
+    if not cache_path.resolve().is_relative_to(root.resolve()):
+        sys.exit(f"Refusing to clear {cache_path}, it is outside of the benchmark folder {root}")
+
+    print(f"{'state':<6} {'run':>3} {'wall (s)':>9} {'requests':>9} {'304s':>5} {'KiB':>9} {'builds':>7} {'builds/s':>9}")
+    for state in ("cold", "warm"):
+        for i in range(args.runs):
+            if state == "cold":
+                shutil.rmtree(cache_path, ignore_errors=True)
+                cache_path.mkdir(parents=True)
+
+            manager = make_connection_manager(rewrite=server.local_url)
+            scraper, builds = make_scraper(manager)
+            server.reset_stats()
+
+            start = time.perf_counter()
+            scraper.get_download_links(check_launcher_version=True)
+            wall = time.perf_counter() - start
+            manager.cache.log_stats()
+
+            print(
+                f"{state:<6} {i:>3} {wall:>9.3f} {server.requests:>9} {server.not_modified:>5} "
+                f"{server.bytes_sent / 1024:>9.1f} {len(builds):>7} {len(builds) / wall:>9.1f}"
+            )
+
+    server.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="Record the responses of a real scrape")
+    record_parser.add_argument("fixtures", type=Path)
+
+    run_parser = subparsers.add_parser("run", help="Benchmark the scraper against recorded responses")
+    run_parser.add_argument("fixtures", type=Path)
+    run_parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    run_parser.add_argument("--bandwidth", type=float, default=None, help="Bytes per second of every response")
+    run_parser.add_argument("--runs", type=int, default=3, help="Runs per cache state")
+
+    args = parser.parse_args()
+    args.fixtures = args.fixtures.resolve()
+
+    with tempfile.TemporaryDirectory(prefix="bl-benchmark-") as root:
+        isolate_environment(Path(root))
+
+        from PyQt5.QtCore import QCoreApplication
+
+        _app = QCoreApplication(sys.argv[:1])
+
+        if args.command == "record":
+            record(args, Path(root))
+        else:
+            run(args, Path(root))
+
+
+if __name__ == "__main__":
+    main()
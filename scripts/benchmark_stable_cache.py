@@ -0,0 +1,110 @@
+"""
+Benchmark of the stable builds cache storage.
+
+A cache shaped like the one download.blender.org produces is synthesized, then loaded and saved
+both in the original layout (every build as a full .blinfo dictionary, rewritten with json.dump)
+and in the current versioned layout (one row per build, written atomically, folders below the
+minimum version left unloaded).
+
+Usage (from the repository root):
+    python scripts/benchmark_stable_cache.py --folders 60 --builds 30 --minimum 3.0 --runs 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+
+def make_cache(n_folders: int, n_builds: int):
+    from modules.build_info import BuildInfo
+    from modules.scraper_cache import StableCache
+    from semver import Version
+
+    cache = StableCache()
+    date = datetime(2024, 3, 26, 10, 57, tzinfo=timezone.utc)
+    for i in range(n_folders):
+        major, minor = 2 + i // 20, i % 20
+        folder = cache.new_build(Version(major, minor, 0), date - timedelta(days=30 * i))
+        for patch in range(n_builds):
+            subversion = f"{major}.{minor}.{patch}"
+            link = f"https://download.blender.org/release/Blender{major}.{minor}/blender-{subversion}-linux-x64.tar.xz"
+            folder.assets.append(BuildInfo(link, subversion, None, date - timedelta(days=30 * i + patch), "stable"))
+    return cache
+
+
+def v1_dict(cache) -> dict:
+    return {
+        "folders": {
+            str(v): {
+                "assets": [(build.link, build.to_dict()) for build in folder.assets],
+                "modified_date": folder.modified_date.isoformat(),
+            }
+            for v, folder in cache.folders.items()
+        }
+    }
+
+
+def timed(fn, runs: int) -> float:
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--folders", type=int, default=60, help="Release folders in the cache")
+    parser.add_argument("--builds", type=int, default=30, help="Builds per folder")
+    parser.add_argument("--minimum", default="3.0", help="Minimum stable version to load")
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    from modules.build_info import parse_blender_ver
+    from modules.scraper_cache import StableCache
+
+    minimum_version = parse_blender_ver(args.minimum)
+    cache = make_cache(args.folders, args.builds)
+
+    with tempfile.TemporaryDirectory(prefix="bl-benchmark-") as root:
+        v1_path = Path(root, "stable_builds.json")
+        v2_path = Path(root, "stable_builds_v2.json")
+
+        def save_v1():
+            with v1_path.open("w", encoding="utf-8") as f:
+                json.dump(v1_dict(cache), f)
+
+        def load_v1():
+            StableCache.load(v1_path, minimum_version)
+
+        def save_v2():
+            cache.save(v2_path)
+
+        def load_v2():
+            StableCache.load(v2_path, minimum_version)
+
+        save_v1()
+        save_v2()
+
+        print(f"{args.folders} folders x {args.builds} builds, minimum version {minimum_version}")
+        print(f"{'layout':<10} {'KiB':>9} {'load (ms)':>10} {'save (ms)':>10}")
+        layouts = (("original", v1_path, load_v1, save_v1), ("versioned", v2_path, load_v2, save_v2))
+        for name, path, load, save in layouts:
+            print(
+                f"{name:<10} {path.stat().st_size / 1024:>9.1f} "
+                f"{timed(load, args.runs) * 1000:>10.2f} {timed(save, args.runs) * 1000:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
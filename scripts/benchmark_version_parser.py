@@ -0,0 +1,204 @@
+"""
+Regression corpus and benchmark of parse_blender_ver.
+
+Every version string of the corpus is parsed by parse_blender_ver and by the original
+implementation (one semver parse, the platform suffix cleaner, then each matcher in turn),
+and both must give the same Version, or both fail. Random mutations of the corpus are
+compared as well. The time taken to parse the corpus is reported for both, with the
+cache of parse_blender_ver cleared before every run.
+
+Usage (from the repository root):
+    python scripts/benchmark_version_parser.py --runs 200 --mutations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+from semver import Version  # noqa: E402
+
+# Real version strings, as found in release folders, builder.blender.org listings and `blender -v`
+CORPUS = (
+    # release folders
+    "1.0",
+    "2.49",
+    "2.5",
+    "2.79",
+    "4.1",
+    # stable releases
+    "2.49b",
+    "2.79a",
+    "2.79b",
+    "2.79rc1",
+    "2.80rc3",
+    "2.82a",
+    "2.83.20",
+    "2.93.18",
+    "3.0.0",
+    "3.6.12",
+    "4.1.1",
+    # `blender -v` and old .blinfo subversions
+    "2.80 (sub 75)",
+    "2.81 (sub 16)",
+    "2.80.0 Alpha",
+    "2.90.0 Beta",
+    "4.2.0 Alpha",
+    "3.3.0 Release Candidate",
+    "4.0.0-beta",
+    "3.6.5-lts",
+    "2.80.75",
+    # builder.blender.org versions
+    "4.2.0-alpha+daily.a1b2c3d4e5f6",
+    "4.2.0-alpha+main.4d3a6f2b8c1e",
+    "4.3.0-beta+v43.0b7a8f9e1c2d",
+    "4.2.0-alpha+PR12345.abcdef123456",
+    "4.2.0-alpha+npr-prototype.b2a3e4c5d6f7",
+    "3.6.0-stable+v36.0a1b2c3d4e5",
+    # archive and folder names
+    "blender-2.79-e045fe53f1b0-win64",
+    "blender-2.79b-linux-glibc219-x86_64",
+    "blender-2.79b-windows64",
+    "blender-2.80rc3-windows64",
+    "blender-2.83.20-linux-x64",
+    "blender-3.6.12-macos-arm64",
+    "blender-4.1.1-windows-x64",
+    "blender-4.1.1-windows-x64.zip",
+    "blender-4.2.0-alpha+main.4d3a6f2b8c1e-linux.x86_64-release",
+    "blender-4.2.0-alpha+main.4d3a6f2b8c1e-linux.x86_64-release.tar.xz",
+    "blender-4.3.0-beta+v43.0b7a8f9e1c2d-windows.amd64-release",
+    "blender-4.2.0-alpha+PR12345.abcdef123456-darwin.arm64-release",
+    "blender-4.2.0-alpha+npr-prototype.b2a3e4c5d6f7-windows.amd64-release",
+    "Blender4.1",
+    # not versions
+    "",
+    "blender",
+    "latest",
+)
+
+_matchers = tuple(
+    map(
+        re.compile,
+        (
+            r"(?P<ma>\d+)\.(?P<mi>\d+)\.(?P<pa>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",
+            r"(?P<ma>\d+)\.(?P<mi>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",
+            r"(?P<ma>\d+)\.(?P<mi>\d+) \(sub (?P<pa>\d+)\)",
+            r"(?P<ma>\d+)\.(?P<mi>\d+)$",
+            r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>[^-]{0,3})",
+            r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>\D[^\.\s]*)?",
+        ),
+    )
+)
+_initial_cleaner = re.compile(r"(?!blender-)\d.*(?=-linux|-windows)")
+
+
+def reference_parse(s: str, search=False) -> Version:
+    """The original implementation of parse_blender_ver, without its cache"""
+    try:
+        return Version.parse(s)
+    except ValueError:
+        m = _initial_cleaner.search(s)
+        if m is not None:
+            s = m.group()
+            try:
+                return Version.parse(s)
+            except ValueError:
+                pass
+
+        g = None
+        for matcher in _matchers:
+            m = matcher.search(s) if search else matcher.match(s)
+            if m is not None:
+                g = m
+                break
+        if g is None:
+            raise ValueError("No valid version found") from None
+
+        patch = int(g.group("pa")) if "pa" in g.groupdict() else 0
+        prerelease = None
+        if "pre" in g.groupdict() and g.group("pre") is not None:
+            prerelease = g.group("pre").casefold().strip("- ")
+        return Version(major=int(g.group("ma")), minor=int(g.group("mi")), patch=patch, prerelease=prerelease)
+
+
+def outcome(parse, s: str, search: bool) -> str:
+    try:
+        v = parse(s, search)
+    except ValueError:
+        return "ValueError"
+    return repr(v)
+
+
+def mutate(rng: random.Random, s: str) -> str:
+    alphabet = "0123456789.-+ ()abrcsublinuxwindowsalphabeta"
+    chars = list(s)
+    for _ in range(rng.randint(1, 3)):
+        op = rng.randrange(3)
+        pos = rng.randint(0, len(chars))
+        if op == 0:
+            chars.insert(pos, rng.choice(alphabet))
+        elif chars and op == 1:
+            del chars[min(pos, len(chars) - 1)]
+        elif chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(alphabet)
+    return "".join(chars)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--mutations", type=int, default=20000, help="Random variations of the corpus to compare")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from modules.build_info import parse_blender_ver
+
+    rng = random.Random(args.seed)
+    cases = list(CORPUS)
+    cases += [mutate(rng, rng.choice(CORPUS)) for _ in range(args.mutations)]
+
+    mismatches = 0
+    for s in cases:
+        for search in (False, True):
+            parse_blender_ver.cache_clear()
+            expected = outcome(reference_parse, s, search)
+            actual = outcome(parse_blender_ver, s, search)
+            if expected != actual:
+                mismatches += 1
+                print(f"MISMATCH {s!r} search={search}: expected {expected}, got {actual}")
+
+    print(f"{len(cases)} strings compared, {mismatches} mismatches")
+
+    def timed(parse, clear) -> float:
+        best = float("inf")
+        for _ in range(args.runs):
+            clear()
+            start = time.perf_counter()
+            for s in CORPUS:
+                for search in (False, True):
+                    try:
+                        parse(s, search)
+                    except ValueError:
+                        pass
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    n = len(CORPUS) * 2
+    reference = timed(reference_parse, lambda: None)
+    current = timed(parse_blender_ver, parse_blender_ver.cache_clear)
+    print(f"{'parser':<10} {'us/string':>10}")
+    print(f"{'original':<10} {reference / n * 1e6:>10.2f}")
+    print(f"{'current':<10} {current / n * 1e6:>10.2f}")
+
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
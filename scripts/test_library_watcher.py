@@ -0,0 +1,146 @@
+"""
+Checks of what the library watcher reports while builds are still being written.
+
+A build is extracted slowly into a synthetic library, deep folders first and its executable last,
+the way a download is extracted. The watcher must not report it before the extraction is done, and
+must report it once as a build afterwards. Builds of a branch folder the launcher paused must not be
+reported until the folder is resumed. Both the inotify watcher (on Linux) and the polling fallback
+are checked, with a shorter settle time than the launcher's.
+
+The checks run with pytest or on their own, and exit with 1 when one fails.
+
+Usage (from the repository root):
+    python scripts/test_library_watcher.py
+"""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+SOURCE = Path(__file__).resolve().parent.parent / "source"
+sys.path.insert(0, str(SOURCE))
+
+from PyQt5.QtCore import Qt  # noqa: E402
+from threads import folder_observer  # noqa: E402
+from threads.folder_observer import FolderObserver, PausedFolders  # noqa: E402
+
+SETTLE_TIME = 0.5
+POLL_INTERVAL = 0.2
+
+
+class Watching:
+    """Runs a FolderObserver on a synthetic library and records what it reports, with the time."""
+
+    def __init__(self, library_folder: Path, polling: bool, paused: PausedFolders | None = None):
+        folder_observer.SETTLE_TIME = SETTLE_TIME
+        folder_observer.MIN_POLL_INTERVAL = POLL_INTERVAL
+        self.reports: list[tuple[str, Path, float]] = []
+        self.observer = FolderObserver(library_folder, paused=paused)
+        for kind in ("found", "unrecognized", "removed"):
+            getattr(self.observer, kind).connect(
+                lambda path, kind=kind: self.reports.append((kind, path, time.monotonic())),
+                Qt.ConnectionType.DirectConnection,
+            )
+        self.thread = threading.Thread(target=self.observer.poll if polling else self.observer.run, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        # Let it take its first snapshot
+        time.sleep(POLL_INTERVAL)
+        return self
+
+    def __exit__(self, *exc):
+        self.observer.stop()
+        self.thread.join()
+
+
+def extract_slowly(build: Path, exe_name: str, seconds: float) -> float:
+    """Writes a build the way an archive is extracted, returns when the last file was written"""
+    (build / "4.2" / "scripts").mkdir(parents=True)
+    end = time.monotonic() + seconds
+    i = 0
+    while time.monotonic() < end:
+        folder = build / "4.2" / "scripts" / f"module_{i // 5}"
+        folder.mkdir(exist_ok=True)
+        (folder / f"file_{i}.py").write_text("pass\n", encoding="utf-8")
+        i += 1
+        time.sleep(0.1)
+
+    (build / exe_name).write_bytes(b"\0")
+    return time.monotonic()
+
+
+def check_slow_nested_extraction(polling: bool):
+    with tempfile.TemporaryDirectory(prefix="bl-test-") as root:
+        library_folder = Path(root)
+        (library_folder / "stable").mkdir()
+        build = library_folder / "stable" / "blender-4.2.0-linux-x64"
+
+        with Watching(library_folder, polling) as watching:
+            build.mkdir()
+            done = extract_slowly(build, watching.observer.blender_exe, SETTLE_TIME * 5)
+            time.sleep(SETTLE_TIME * 3 + POLL_INTERVAL)
+
+        assert [(kind, path) for kind, path, _ in watching.reports] == [("found", build)], watching.reports
+        assert watching.reports[0][2] >= done, "reported before the extraction was done"
+
+
+def check_paused_folder(polling: bool):
+    with tempfile.TemporaryDirectory(prefix="bl-test-") as root:
+        library_folder = Path(root)
+        (library_folder / "stable").mkdir()
+        build = library_folder / "stable" / "blender-4.2.0-linux-x64"
+        paused = PausedFolders()
+
+        with Watching(library_folder, polling, paused) as watching:
+            paused.pause(library_folder / "stable")
+            build.mkdir()
+            (build / "readme.txt").write_text("", encoding="utf-8")
+            time.sleep(SETTLE_TIME * 4)
+            assert watching.reports == [], watching.reports
+
+            paused.resume(library_folder / "stable")
+            time.sleep(SETTLE_TIME * 3 + POLL_INTERVAL)
+
+        assert [(kind, path) for kind, path, _ in watching.reports] == [("unrecognized", build)], watching.reports
+
+
+def test_slow_nested_extraction_polling():
+    check_slow_nested_extraction(polling=True)
+
+
+def test_paused_folder_polling():
+    check_paused_folder(polling=True)
+
+
+if sys.platform.startswith("linux"):
+
+    def test_slow_nested_extraction_inotify():
+        check_slow_nested_extraction(polling=False)
+
+    def test_paused_folder_inotify():
+        check_paused_folder(polling=False)
+
+
+def main():
+    failures = 0
+    for name, test in list(globals().items()):
+        if not name.startswith("test_"):
+            continue
+        try:
+            test()
+        except AssertionError as e:
+            failures += 1
+            print(f"FAIL {name}: {e}")
+        else:
+            print(f"ok   {name}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
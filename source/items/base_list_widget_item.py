@@ -1,59 +1,67 @@
 from __future__ import annotations
 
-import re
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Callable
-from datetime import timezone
-from modules._platform import set_locale
+
 from PyQt5.QtWidgets import QListWidgetItem
 
 if TYPE_CHECKING:
+    from modules.build_info import BuildInfo
     from semver import Version
     from widgets.base_list_widget import BaseListWidget
 
+# Orders releases after their prereleases, like semver does
+_RELEASE = (1, ())
 
-class BaseListWidgetItem(QListWidgetItem):
-    def __init__(self, date=None):
-        super().__init__()
-        self.date = date
-        self.listWidget: Callable[[], BaseListWidget | None]
 
-    def __lt__(self, other):
-        soring_type = self.listWidget().parent.sorting_type
+def version_key(v: Version) -> tuple:
+    """A tuple ordered the way semver orders versions, build metadata aside."""
+    if not v.prerelease:
+        return (v.major, v.minor, v.patch, _RELEASE)
 
-        if soring_type.name == "DATETIME":
-            return self.compare_datetime(other)
-        if soring_type.name == "VERSION":
-            return self.compare_version(other)
-        return False
+    # Numeric identifiers come before alphanumeric ones and are compared as numbers
+    identifiers = tuple((0, int(part), "") if part.isdigit() else (1, 0, part) for part in v.prerelease.split("."))
+    return (v.major, v.minor, v.patch, (0, identifiers))
 
-    def compare_datetime(self, other):
-        if (self.date is None) or (other.date is None):
-            return False
 
-        if self.date.tzinfo is None or other.date.tzinfo is None:
-            self.date = self.date.replace(tzinfo=timezone.utc)
-            other.date = other.date.replace(tzinfo=timezone.utc)
+def utc_timestamp(date: datetime) -> float:
+    """Timestamp of `date`, taken as UTC when it's naive."""
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date.timestamp()
 
-        return self.date > other.date
 
-    def compare_version(self, other):
-        list_widget = self.listWidget()
+class BaseListWidgetItem(QListWidgetItem):
+    """
+    A row of a build list. Its sort keys are computed once from the build information,
+    so sorting a list compares plain tuples and floats.
+    """
 
-        this_widget = list_widget.itemWidget(self)
-        other_widget = list_widget.itemWidget(other)
+    def __init__(self, build_info: BuildInfo | None = None):
+        super().__init__()
+        self.listWidget: Callable[[], BaseListWidget | None]
+        self.date: datetime | None = None
+        # Commit time as a UTC timestamp, and the version followed by it
+        self.date_key: float | None = None
+        self.version_key: tuple | None = None
 
-        if (
-            this_widget is None
-            or other_widget is None
-            or this_widget.build_info is None
-            or other_widget.build_info is None
-        ):
-            return False
+        if build_info is not None:
+            self.set_build_info(build_info)
 
-        this_version: Version = this_widget.build_info.semversion
-        other_version: Version = other_widget.build_info.semversion
+    def set_build_info(self, build_info: BuildInfo):
+        self.date = build_info.commit_time
+        self.date_key = utc_timestamp(build_info.commit_time)
+        self.version_key = (version_key(build_info.semversion), self.date_key)
 
-        if this_version == other_version:
-            return self.compare_datetime(other)
+    def __lt__(self, other):
+        sorting_type = self.listWidget().parent.sorting_type.name
 
-        return this_version > other_version
+        if sorting_type == "DATETIME":
+            if self.date_key is None or other.date_key is None:
+                return False
+            return self.date_key > other.date_key
+        if sorting_type == "VERSION":
+            if self.version_key is None or other.version_key is None:
+                return False
+            return self.version_key > other.version_key
+        return False
@@ -3,9 +3,8 @@ import os
 import platform
 import sys
 from functools import cache
-from locale import LC_ALL, getdefaultlocale, setlocale
 from pathlib import Path
-from subprocess import DEVNULL, PIPE, STDOUT, Popen, call, check_call, check_output
+from subprocess import DEVNULL, PIPE, STDOUT, Popen, call, check_call
 from tempfile import NamedTemporaryFile
 
 
@@ -38,22 +37,6 @@ def get_platform_full():
     return f"{get_platform()} {os.name} {platform.release()}"
 
 
-def set_locale():
-    platform = get_platform()
-
-    if platform == "Windows":
-        setlocale(LC_ALL, "eng_usa")
-    elif platform in {"Linux", "macOS"}:
-        setlocale(LC_ALL, "en_US.UTF-8")
-
-
-default_locale = getdefaultlocale(("LC_ALL",))[0]
-
-
-def reset_locale():
-    setlocale(LC_ALL, default_locale)
-
-
 def show_windows_help(parser: argparse.ArgumentParser):
     with (
         NamedTemporaryFile("w+", suffix=".bat", delete=False) as f,
@@ -149,17 +132,6 @@ def _call(args):
         pass
 
 
-def _check_output(args):
-    platform = get_platform()
-
-    if platform == "Windows":
-        from subprocess import CREATE_NO_WINDOW
-
-        return check_output(args, creationflags=CREATE_NO_WINDOW, shell=True, stderr=DEVNULL, stdin=DEVNULL)
-
-    return check_output(args, shell=False, stderr=DEVNULL, stdin=DEVNULL)
-
-
 @cache
 def is_frozen():
     """
@@ -237,4 +209,25 @@ def get_cache_path():
 
 
 def stable_cache_path():
+    # Older launchers can't read the versioned layout, they keep using the original file
+    return Path(get_cache_path(), "stable_builds_v2.json")
+
+
+def legacy_stable_cache_path():
     return Path(get_cache_path(), "stable_builds.json")
+
+
+def automated_cache_path():
+    return Path(get_cache_path(), "automated_builds.json")
+
+
+def launcher_cache_path():
+    return Path(get_cache_path(), "launcher_releases.json")
+
+
+def probe_cache_path():
+    return Path(get_cache_path(), "probe_cache.json")
+
+
+def response_cache_path():
+    return Path(get_cache_path(), "http_cache")
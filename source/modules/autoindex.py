@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import codecs
+import re
+from html import unescape
+from typing import TYPE_CHECKING, NamedTuple
+
+from modules.date_parsing import parse_autoindex_date
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from datetime import datetime
+
+# A link of a listing, followed by the date and size columns of its row if there are any:
+#   nginx:  <a href="Blender4.1/">Blender4.1/</a>                    26-Mar-2024 10:57                   -
+#   Apache: <a href="blender-2.79b.tar.gz">blender-2.79b.tar.gz</a>   2018-03-22 14:05   32M
+_row = re.compile(
+    r"<a\s+href=\"(?P<href>[^\"]*)\"[^>]*>[^<]*</a>[ \t]*"
+    r"(?:(?P<date>\d{2}-[A-Za-z]{3}-\d{4} \d{2}:\d{2}|\d{4}-\d{2}-\d{2} \d{2}:\d{2})[ \t]+(?P<size>[\d.]+[KMGT]?|-)?)?",
+    re.IGNORECASE,
+)
+
+_size_units = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+class AutoindexEntry(NamedTuple):
+    href: str
+    date: datetime | None
+    size: int | None
+
+
+def parse_size(s: str | None) -> int | None:
+    if not s or s == "-":
+        return None
+
+    unit = s[-1].upper() if s[-1].isalpha() else ""
+    number = s[:-1] if unit else s
+    return int(float(number) * _size_units[unit])
+
+
+def parse_autoindex(chunks: Iterable[bytes]) -> Iterator[AutoindexEntry]:
+    """
+    Parses an nginx or Apache directory listing line by line as its chunks arrive,
+    without building a document tree. Yields every link except the parent directory one.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+
+    for chunk in chunks:
+        buffer += decoder.decode(chunk)
+
+        # Rows never span several lines, only parse the complete ones
+        end = buffer.rfind("\n") + 1
+        if end:
+            yield from _parse_lines(buffer[:end])
+            buffer = buffer[end:]
+
+    buffer += decoder.decode(b"", final=True)
+    yield from _parse_lines(buffer)
+
+
+def _parse_lines(text: str) -> Iterator[AutoindexEntry]:
+    for m in _row.finditer(text):
+        href = unescape(m.group("href"))
+        if href in {"../", ".."}:
+            continue
+
+        date = m.group("date")
+        try:
+            modified_date = parse_autoindex_date(date) if date else None
+        except ValueError:
+            modified_date = None
+
+        yield AutoindexEntry(href, modified_date, parse_size(m.group("size")))
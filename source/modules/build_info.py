@@ -1,14 +1,19 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from functools import cache
-from typing import TYPE_CHECKING
-
-from modules._platform import _check_output, get_platform, reset_locale, set_locale
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from modules._platform import get_platform
+from modules.date_parsing import parse_blinfo_date, parse_commit_date
+from modules.library_index import get_library_index
+from modules.probe_cache import get_probe_cache
+from modules.probe_executor import get_probe_executor
 from modules.task import Task
 from PyQt5.QtCore import pyqtSignal
 from semver import Version
@@ -16,25 +21,50 @@ from semver import Version
 if TYPE_CHECKING:
     from pathlib import Path
 
-# TODO: Combine some of these
-matchers = tuple(
-    map(
-        re.compile,
-        (  #                                                                                   # format                                 examples
-            r"(?P<ma>\d+)\.(?P<mi>\d+)\.(?P<pa>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",  # <major>.<minor>.<patch> <Prerelease>   2.80.0 Alpha  -> 2.80.0-alpha
-            # r"(?P<ma>\d+)\.(?P<mi>\d+)\.(?P<pa>\d+)",  #                                       <major>.<minor>.<patch>                3.0.0         -> 3.0.0
-            r"(?P<ma>\d+)\.(?P<mi>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",
-            r"(?P<ma>\d+)\.(?P<mi>\d+) \(sub (?P<pa>\d+)\)",  #                                  <major>.<minor> (sub <patch>)          2.80 (sub 75) -> 2.80.75
-            r"(?P<ma>\d+)\.(?P<mi>\d+)$",  #                                                     <major>.<minor>                        2.79          -> 2.79.0
-            r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>[^-]{0,3})",  #                                    <major>.<minor><[chars]*(1-3)>         2.79rc1       -> 2.79.0-rc1
-            r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>\D[^\.\s]*)?",  #                                  <major>.<minor><patch?>                2.79          -> 2.79.0       | 2.79b -> 2.79.0-b
-        ),
-    )
+_T = TypeVar("_T")
+
+# Blender's styles of versioning, in order of precedence:
+#   format                                 examples
+matchers = (
+    r"(?P<ma>\d+)\.(?P<mi>\d+)\.(?P<pa>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",  # <major>.<minor>.<patch> <Prerelease>   2.80.0 Alpha  -> 2.80.0-alpha
+    r"(?P<ma>\d+)\.(?P<mi>\d+)[ \-](?P<pre>[^+]*[^wli][^ndux][^s]?)",
+    r"(?P<ma>\d+)\.(?P<mi>\d+) \(sub (?P<pa>\d+)\)",  #                                  <major>.<minor> (sub <patch>)          2.80 (sub 75) -> 2.80.75
+    r"(?P<ma>\d+)\.(?P<mi>\d+)$",  #                                                     <major>.<minor>                        2.79          -> 2.79.0
+    r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>[^-]{0,3})",  #                                    <major>.<minor><[chars]*(1-3)>         2.79rc1       -> 2.79.0-rc1
+    r"(?P<ma>\d+)\.(?P<mi>\d+)(?P<pre>\D[^\.\s]*)?",  #                                  <major>.<minor><patch?>                2.79          -> 2.79.0       | 2.79b -> 2.79.0-b
+)
+# A whole semantic version, exactly as semver's Version.parse accepts it
+semver_grammar = (
+    r"(?a:(?P<ma>0|[1-9]\d*)\.(?P<mi>0|[1-9]\d*)\.(?P<pa>0|[1-9]\d*)"
+    r"(?:-(?P<pre>(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?"
+    r"(?:\+(?P<build>[0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?)\Z"
 )
 initial_cleaner = re.compile(r"(?!blender-)\d.*(?=-linux|-windows)")
 
 
-@cache
+def _grammar(search: bool) -> re.Pattern:
+    """
+    Combines the semantic version and every matcher into alternatives of a single pattern, tried in order.
+    Alternative `f<i>` holds the groups of format `i` suffixed with `i`, format 0 being the semantic version.
+    When searching, each matcher is preceded by a lazy `.*?`, so that it's tried at every position
+    before the next one is, like searching with each matcher in turn.
+    """
+    alternatives = [semver_grammar, *matchers]
+    prefix = "(?s:.*?)" if search else ""
+    return re.compile(
+        "|".join(
+            ("" if i == 0 else prefix) + f"(?P<f{i}>" + re.sub(r"\(\?P<(\w+)>", rf"(?P<\g<1>{i}>", pattern) + ")"
+            for i, pattern in enumerate(alternatives)
+        )
+    )
+
+
+grammar = _grammar(search=False)
+search_grammar = _grammar(search=True)
+semver_only = re.compile(semver_grammar)
+
+
+@lru_cache(maxsize=4096)
 def parse_blender_ver(s: str, search=False) -> Version:
     """
     Converts Blender's different styles of versioning to a semver Version.
@@ -48,57 +78,66 @@ def parse_blender_ver(s: str, search=False) -> Version:
     Returns:
         Version
     """
-    try:
-        return Version.parse(s)
-    except ValueError as e:
+    # Build names carry a platform suffix, only their version part is classified
+    if "-linux" in s or "-windows" in s:
+        m = semver_only.match(s)
+        if m is not None:
+            return Version(int(m["ma"]), int(m["mi"]), int(m["pa"]), m["pre"], m["build"])
+
         m = initial_cleaner.search(s)
         if m is not None:
             s = m.group()
-            try:
-                return Version.parse(s)
-            except ValueError:
-                pass
 
-        major = 0
-        minor = 0
-        patch = 0
-        prerelease = None
+    g = (search_grammar if search else grammar).match(s)
+    if g is None:
+        raise ValueError("No valid version found")
 
-        try:
-            g = None
-            if search:
-                for matcher in matchers:
-                    if (m := matcher.search(s)) is not None:
-                        g = m
-                        break
-            else:
-                for matcher in matchers:
-                    if (m := matcher.match(s)) is not None:
-                        g = m
-                        break
-            assert g is not None
-        except (StopIteration, AssertionError):
-            """No matcher gave any valid version"""
-            raise ValueError("No valid version found") from e
-
-        major = int(g.group("ma"))
-        minor = int(g.group("mi"))
-        if "pa" in g.groupdict():
-            patch = int(g.group("pa"))
-        if "pre" in g.groupdict() and g.group("pre") is not None:
-            prerelease = g.group("pre").casefold().strip("- ")
-
-        return Version(major=major, minor=minor, patch=patch, prerelease=prerelease)
-        # print(f"Parsed {s} to {v} using {matcher}")
+    name = g.lastgroup
+    assert name is not None
+    i = name[1:]
+
+    major = int(g[f"ma{i}"])
+    minor = int(g[f"mi{i}"])
+    if i == "0":
+        return Version(major, minor, int(g["pa0"]), g["pre0"], g["build0"])
+
+    patch = 0
+    prerelease = None
+    if f"pa{i}" in grammar.groupindex and g[f"pa{i}"] is not None:
+        patch = int(g[f"pa{i}"])
+    if f"pre{i}" in grammar.groupindex and g[f"pre{i}"] is not None:
+        prerelease = g[f"pre{i}"].casefold().strip("- ")
+
+    return Version(major=major, minor=minor, patch=patch, prerelease=prerelease)
 
 
 oldver_cutoff = Version(2, 83, 0)
 
 
+def _with_slots(cls):
+    """Recreates a dataclass with `__slots__` for its fields, like `dataclass(slots=True)` from Python 3.10"""
+    names = tuple(f.name for f in fields(cls))
+    dct = {k: v for k, v in cls.__dict__.items() if k not in (*names, "__dict__", "__weakref__")}
+    dct["__slots__"] = names
+    return type(cls)(cls.__name__, cls.__bases__, dct)
+
+
+def version_tuple(v: str | None) -> tuple[int, ...]:
+    """A .blinfo file version as comparable numbers, empty when it is missing or malformed"""
+    try:
+        return tuple(int(part) for part in v.split("."))  # type: ignore[union-attr]
+    except (AttributeError, ValueError):
+        return ()
+
+
+@_with_slots
 @dataclass
 class BuildInfo:
     # Class variables
     file_version = "1.3"
+    # Oldest file version whose data is carried over as is when `file_version` changes, every versioned
+    # layout has the fields `from_dict` reads. Unversioned .blinfo files are rebuilt by reading their build again
+    min_upgradable_file_version = "1.0"
     # https://www.blender.org/download/lts/
     lts_tags = ("2.83", "2.93", "3.3", "3.6", "4.3", "4.6")
 
@@ -115,11 +154,30 @@ class BuildInfo:
     def __post_init__(self):
         if self.branch == "stable" and self.subversion.startswith(self.lts_tags):
             self.branch = "lts"
+        # Thousands of builds share a handful of branches
+        self.branch = sys.intern(self.branch)
+
+    @property
+    def identity(self) -> str:
+        """The build hash, or the subversion of builds without one"""
+        return self.build_hash or self.subversion
+
+    def __eq__(self, other: object):
+        return isinstance(other, BuildInfo) and (self.build_hash or self.subversion) == (
+            other.build_hash or other.subversion
+        )
 
-    def __eq__(self, other: BuildInfo):
-        if (self is None) or (other is None):
+    def __hash__(self):
+        return hash(self.build_hash or self.subversion)
+
+    def matches(self, other: BuildInfo | None) -> bool:
+        """
+        Whether both describe the same build even if only one of them knows its build hash,
+        like a stable release in the downloads and the same release once installed.
+        """
+        if other is None:
             return False
-        if (self.build_hash is not None) and (other.build_hash is not None):
+        if self.build_hash and other.build_hash:
             return self.build_hash == other.build_hash
         return self.subversion == other.subversion
 
@@ -195,7 +253,7 @@ class BuildInfo:
         try:
             dt = datetime.fromisoformat(blinfo["commit_time"])
         except ValueError:  # old file version compatibility
-            dt = datetime.strptime(blinfo["commit_time"], "%d-%b-%y-%H:%M").astimezone()
+            dt = parse_blinfo_date(blinfo["commit_time"])
         return cls(
             link,
             blinfo["subversion"],
@@ -224,16 +282,60 @@ class BuildInfo:
         }
 
     def write_to(self, path: Path):
+        """
+        Writes the .blinfo of the build in `path` through a temporary file renamed over it,
+        so that a crash never leaves a partially written one behind.
+        """
         data = self.to_dict()
         blinfo = path / ".blinfo"
-        with blinfo.open("w", encoding="utf-8") as file:
+        tmp = path / ".blinfo.tmp"
+        with tmp.open("w", encoding="utf-8") as file:
             json.dump(data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp, blinfo)
         return data
 
 
+class BuildIndex(Generic[_T]):
+    """
+    Maps builds to values, looked up the way `BuildInfo.matches` compares them:
+    by build hash when both builds have one, by subversion otherwise.
+    """
+
+    def __init__(self):
+        self._by_hash: dict[str, _T] = {}
+        self._by_subversion: dict[str, _T] = {}
+        self._hashless_by_subversion: dict[str, _T] = {}
+
+    def add(self, build_info: BuildInfo, value: _T):
+        if build_info.build_hash:
+            self._by_hash.setdefault(build_info.build_hash, value)
+        else:
+            self._hashless_by_subversion.setdefault(build_info.subversion, value)
+        self._by_subversion.setdefault(build_info.subversion, value)
+
+    def get(self, build_info: BuildInfo | None) -> _T | None:
+        if build_info is None:
+            return None
+        if not build_info.build_hash:
+            return self._by_subversion.get(build_info.subversion)
+
+        value = self._by_hash.get(build_info.build_hash)
+        if value is None:
+            value = self._hashless_by_subversion.get(build_info.subversion)
+        return value
+
+    def __contains__(self, build_info: BuildInfo | None) -> bool:
+        return self.get(build_info) is not None
+
+
 def fill_blender_info(exe: Path, info: BuildInfo | None = None) -> tuple[datetime, str, str, str]:
-    set_locale()
-    version = _check_output([exe.as_posix(), "-v"]).decode("UTF-8")
+    probe_cache = get_probe_cache()
+    version = probe_cache.get(exe)
+    if version is None:
+        version = get_probe_executor().probe(exe)
+        probe_cache.put(exe, version)
     build_hash = ""
     subversion = ""
     custom_name = ""
@@ -244,11 +346,8 @@ def fill_blender_info(exe: Path, info: BuildInfo | None = None) -> tuple[datetim
     if info is None:
         if ctime is not None and cdate is not None:
             try:
-                strptime = datetime.strptime(
-                    f"{cdate[1].rstrip()} {ctime[1].rstrip()}",
-                    "%Y-%m-%d %H:%M",
-                ).astimezone()
-            except Exception:
+                strptime = parse_commit_date(cdate[1].rstrip(), ctime[1].rstrip())
+            except ValueError:
                 strptime = datetime.now().astimezone()
         else:
             strptime = datetime.now().astimezone()
@@ -264,8 +363,6 @@ def fill_blender_info(exe: Path, info: BuildInfo | None = None) -> tuple[datetim
         s = version.splitlines()[0].strip()
         custom_name, subversion = s.rsplit(" ", 1)
 
-    reset_locale()
-
     return (
         strptime,
         build_hash,
@@ -274,6 +371,61 @@ def fill_blender_info(exe: Path, info: BuildInfo | None = None) -> tuple[datetim
     )
 
 
+_archive_hash = re.compile(r"\+[^.]+\.([0-9a-f]{12})(?![0-9a-f])")
+_data_folder = re.compile(r"\d+\.\d+")
+# Version cycles of archive names, as `blender -v` prints them
+_version_cycles = {
+    None: "",
+    "stable": "",
+    "release": "",
+    "alpha": " Alpha",
+    "beta": " Beta",
+    "candidate": " Release Candidate",
+    "rc": " Release Candidate",
+}
+
+
+def static_blender_info(exe: Path, name: str, info: BuildInfo | None = None) -> tuple[datetime, str, str, str] | None:
+    """
+    Gathers what `fill_blender_info` would from `blender -v` without running anything, when the files
+    tell it all: the version spelled out in the archive or folder name, matching the single `X.Y` data
+    folder of the build, the build hash from the archive name or the previous build info, and the commit
+    time of the previous build info. Returns None when any of them is missing or they disagree.
+    """
+    if info is None or not exe.is_file():
+        return None
+
+    resources = exe.parent.parent / "Resources" if get_platform() == "macOS" else exe.parent
+    try:
+        folders = [p.name for p in resources.iterdir() if p.is_dir() and _data_folder.fullmatch(p.name)]
+    except OSError:
+        return None
+    if len(folders) != 1:
+        return None
+
+    try:
+        v = parse_blender_ver(name, search=True)
+    except ValueError:
+        return None
+    if v < oldver_cutoff or f"{v.major}.{v.minor}" != folders[0] or f"{v.major}.{v.minor}.{v.patch}" not in name:
+        return None
+
+    cycle = v.prerelease.split(".")[0] if v.prerelease else None
+    if cycle not in _version_cycles:
+        return None
+
+    build_hash = info.build_hash or ""
+    if m := _archive_hash.search(name):
+        if build_hash and build_hash != m[1]:
+            return None
+        build_hash = m[1]
+    if not build_hash:
+        return None
+
+    subversion = f"{v.major}.{v.minor}.{v.patch}{_version_cycles[cycle]}"
+    return info.commit_time, build_hash, subversion, ""
+
+
 def read_blender_version(
     path: Path,
     old_build_info: BuildInfo | None = None,
@@ -289,11 +441,18 @@ def read_blender_version(
         }.get(get_platform(), "blender")
 
         exe_path = path / blender_exe
-    commit_time, build_hash, subversion, custom_name = fill_blender_info(exe_path, info=old_build_info)
+    name = archive_name or path.name
 
-    subfolder = path.parent.name
+    # Running the executable is only needed when its version can't be told from the files
+    static_info = None
+    if old_build_info is None or not old_build_info.custom_executable:
+        static_info = static_blender_info(exe_path, name, old_build_info)
+    if static_info is not None:
+        commit_time, build_hash, subversion, custom_name = static_info
+    else:
+        commit_time, build_hash, subversion, custom_name = fill_blender_info(exe_path, info=old_build_info)
 
-    name = archive_name or path.name
+    subfolder = path.parent.name
     branch = subfolder
     if subfolder == "daily":
         # If branch from console is empty, it is probably stable release
@@ -333,23 +492,6 @@ def read_blender_version(
     )
 
 
-@dataclass(frozen=True)
-class WriteBuildTask(Task):
-    written = pyqtSignal()
-    error = pyqtSignal()
-
-    path: Path
-    build_info: BuildInfo
-
-    def run(self):
-        try:
-            self.build_info.write_to(self.path)
-            self.written.emit()
-        except Exception:
-            self.error.emit()
-            raise
-
-
 def fill_build_info(
     path: Path,
     archive_name: str | None = None,
@@ -365,6 +507,12 @@ def fill_build_info(
 
         build_info = BuildInfo.from_dict(path.as_posix(), data["blinfo"][0])
 
+        # Files written by a newer launcher are left as they are
+        file_version = version_tuple(data.get("file_version"))
+        if file_version > version_tuple(BuildInfo.file_version):
+            get_library_index().put(path, build_info)
+            return build_info
+
         # Check if file version changed
         if ("file_version" not in data) or (data["file_version"] != BuildInfo.file_version):
             new_build_info = read_blender_version(
@@ -373,7 +521,9 @@ def fill_build_info(
                 archive_name,
             )
             new_build_info.write_to(path)
+            get_library_index().put(path, new_build_info)
             return new_build_info
+        get_library_index().put(path, build_info)
         return build_info
 
     # Generating new build information
@@ -384,6 +534,7 @@ def fill_build_info(
     )
     if auto_write:
         build_info.write_to(path)
+        get_library_index().put(path, build_info)
     return build_info
 
 
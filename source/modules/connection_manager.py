@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import ssl
 import sys
-from typing import TYPE_CHECKING, Union
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from time import perf_counter
+from typing import TYPE_CHECKING, Callable, TypeVar, Union
 
 from modules._platform import get_cwd, get_platform_full, is_frozen
+from modules.request_metrics import RequestMetrics
+from modules.response_cache import ResponseCache
 from modules.settings import (
     get_proxy_host,
     get_proxy_password,
@@ -18,7 +23,10 @@ from urllib3 import PoolManager, ProxyManager, make_headers
 from urllib3.contrib.socks import SOCKSProxyManager
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from semver import Version
+    from urllib3 import HTTPResponse
 
 proxy_types_chemes = {
     1: "http://",
@@ -29,6 +37,13 @@ proxy_types_chemes = {
 
 REQUEST_MANAGER = Union[PoolManager, ProxyManager, SOCKSProxyManager]
 
+# Upper bound of requests in flight at once. Kept below the per-host pool `maxsize`
+# so that concurrent fetches reuse pooled connections instead of opening throwaway ones
+MAX_CONCURRENT_REQUESTS = 8
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
 
 # TODO
 # It is impossible to kill existing instance of PoolManager
@@ -45,6 +60,8 @@ class ConnectionManager(QObject):
             proxy_type = get_proxy_type()
         self.proxy_type = proxy_type
         self.manager: REQUEST_MANAGER | None = None
+        self.cache = ResponseCache()
+        self.metrics = RequestMetrics()
 
         # Basic Headers
         self._headers = {"user-agent": f"Blender-Launcher-v2/{self.version!s} ({get_platform_full()})"}
@@ -122,10 +139,75 @@ class ConnectionManager(QObject):
                         proxy_headers=auth_headers,
                     )
 
-    def request(self, _method, _url, fields=None, headers=None, **urlopen_kw):
+    def request(self, _method, _url, fields=None, headers=None, cache=False, **urlopen_kw):
+        """
+        When `cache` is set, GET responses are revalidated against the on-disk response cache
+        and served from it when the server answers 304 Not Modified.
+        """
+        start_time = perf_counter()
+        cache_hit = False
         try:
             assert self.manager is not None
-            return self.manager.request(_method, _url, fields, headers, **urlopen_kw)
+            if cache and _method == "GET":
+                r, cache_hit = self._cached_request(_url, fields, headers, **urlopen_kw)
+            else:
+                # Explicit headers replace the default ones in urllib3, so merge them back
+                if headers is not None:
+                    headers = {**self._headers, **headers}
+                r = self.manager.request(_method, _url, fields, headers, **urlopen_kw)
         except Exception:
+            self.metrics.record(_url, perf_counter() - start_time, error=True)
             self.error.emit()
             return None
+
+        transferred = 0
+        if not cache_hit:
+            if "content-length" in r.headers:
+                transferred = int(r.headers["content-length"])
+            elif urlopen_kw.get("preload_content", True):
+                transferred = len(r.data or b"")
+
+        self.metrics.record(
+            _url,
+            perf_counter() - start_time,
+            transferred=transferred,
+            error=r.status >= 400,
+            cache_hit=cache_hit,
+        )
+        return r
+
+    def _cached_request(self, url, fields, headers, **urlopen_kw) -> tuple[HTTPResponse, bool]:
+        """Returns the response and whether it was served from the cache."""
+        assert self.manager is not None
+        # Explicit headers replace the default ones in urllib3, so merge them back
+        headers = {**self._headers, **(headers or {})}
+        conditional_headers = {**headers, **self.cache.conditional_headers(url)}
+        r = self.manager.request("GET", url, fields, conditional_headers, **urlopen_kw)
+
+        if r.status == 304:
+            r.release_conn()
+            cached = self.cache.cached_response(url)
+            if cached is not None:
+                return cached, True
+            # The stored body disappeared in the meantime
+            return self.manager.request("GET", url, fields, headers, **urlopen_kw), False
+
+        body = self.cache.store(url, r)
+        if body is not None and not urlopen_kw.get("preload_content", True):
+            # The stream was consumed to store it, hand out the stored bytes instead
+            r.release_conn()
+            return self.cache.response(url, BytesIO(body), len(body), r.headers.get("content-type")), False
+        return r, False
+
+    def concurrent_map(self, fn: Callable[[_T], _R], items: Iterable[_T]) -> list[_R]:
+        """
+        Calls `fn` on every item with at most MAX_CONCURRENT_REQUESTS running at once.
+        `fn` is expected to do its requests through this manager, sharing its connection pool.
+        Results are returned in the order of `items`, regardless of which finished first.
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [fn(item) for item in items]
+
+        with ThreadPoolExecutor(max_workers=min(len(items), MAX_CONCURRENT_REQUESTS)) as executor:
+            return list(executor.map(fn, items))
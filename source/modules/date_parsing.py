@@ -0,0 +1,99 @@
+"""
+Parsers of the dates found in HTTP headers, autoindex listings, `blender -v` and old .blinfo files.
+
+They only accept the English month names these formats use, whatever the process locale is,
+so that they don't need `strptime` and a process wide `setlocale` around it.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+_months = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+# IMF-fixdate, the only format servers send nowadays: "Tue, 26 Mar 2024 10:57:08 GMT"
+_http_date = re.compile(r"(?a:[A-Za-z]{3}, (\d{2}) ([A-Za-z]{3}) (\d{4}) (\d{2}):(\d{2}):(\d{2}) GMT)\Z")
+# nginx: "26-Mar-2024 10:57", Apache: "2024-03-26 10:57"
+_autoindex_date = re.compile(
+    r"(?a:(\d{2})-([A-Za-z]{3})-(\d{4}) (\d{2}):(\d{2})|(\d{4})-(\d{2})-(\d{2}) (\d{2}):(\d{2}))\Z"
+)
+# `build commit date: 2024-03-26` and `build commit time: 10:57`
+_commit_date = re.compile(r"(?a:(\d{4})-(\d{2})-(\d{2}))\Z")
+_commit_time = re.compile(r"(?a:(\d{2}):(\d{2}))\Z")
+# Commit times of .blinfo files before ISO 8601 ones: "26-Mar-24-10:57"
+_blinfo_date = re.compile(r"(?a:(\d{2})-([A-Za-z]{3})-(\d{2})-(\d{2}):(\d{2}))\Z")
+
+
+def _month(name: str) -> int:
+    try:
+        return _months[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown month {name!r}") from None
+
+
+def parse_http_date(s: str) -> datetime:
+    """Parses an HTTP date like `Last-Modified` into an aware UTC datetime."""
+    m = _http_date.match(s)
+    if m is None:
+        # The obsolete RFC 850 and asctime formats
+        try:
+            dt = parsedate_to_datetime(s)
+        except (TypeError, ValueError, IndexError):
+            raise ValueError(f"Invalid HTTP date {s!r}") from None
+        return dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+
+    day, month, year, hour, minute, second = m.groups()
+    return datetime(int(year), _month(month), int(day), int(hour), int(minute), int(second), tzinfo=timezone.utc)
+
+
+def parse_autoindex_date(s: str) -> datetime:
+    """Parses the date column of an nginx or Apache listing, which is printed in UTC."""
+    m = _autoindex_date.match(s)
+    if m is None:
+        raise ValueError(f"Invalid autoindex date {s!r}")
+
+    day, month, year, hour, minute, *apache = m.groups()
+    if day is None:
+        year, month, day, hour, minute = apache
+        return datetime(int(year), int(month), int(day), int(hour), int(minute), tzinfo=timezone.utc)
+    return datetime(int(year), _month(month), int(day), int(hour), int(minute), tzinfo=timezone.utc)
+
+
+def parse_commit_date(date: str, time: str) -> datetime:
+    """Parses the `build commit date` and `build commit time` printed by `blender -v`, as local time."""
+    d = _commit_date.match(date)
+    t = _commit_time.match(time)
+    if d is None or t is None:
+        raise ValueError(f"Invalid commit date {date!r} {time!r}")
+
+    year, month, day = d.groups()
+    hour, minute = t.groups()
+    return datetime(int(year), int(month), int(day), int(hour), int(minute)).astimezone()
+
+
+def parse_blinfo_date(s: str) -> datetime:
+    """Parses the commit time of old .blinfo files, as local time."""
+    m = _blinfo_date.match(s)
+    if m is None:
+        raise ValueError(f"Invalid .blinfo date {s!r}")
+
+    day, month, year, hour, minute = m.groups()
+    # Two digit years pivot like strptime's %y
+    year = int(year)
+    year += 1900 if year >= 69 else 2000
+    return datetime(year, _month(month), int(day), int(hour), int(minute)).astimezone()
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from modules.settings import get_library_folder
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from modules.build_info import BuildInfo
+
+logger = logging.getLogger()
+
+INDEX_NAME = ".library_index.db"
+# Bumped whenever the layout of the table changes, older indexes are rebuilt from the .blinfo files
+INDEX_VERSION = 1
+# A build changed within this many nanoseconds of being indexed might have changed again without
+# its folder's mtime moving, on file systems with a coarse mtime. Such entries are read again.
+RACY_WINDOW_NS = 2_000_000_000
+
+
+class IndexEntry(NamedTuple):
+    mtime_ns: int
+    indexed_ns: int
+    file_version: str
+    blinfo: dict
+
+    def is_valid(self, mtime_ns: int, file_version: str) -> bool:
+        return (
+            self.mtime_ns == mtime_ns
+            and self.file_version == file_version
+            and mtime_ns < self.indexed_ns - RACY_WINDOW_NS
+        )
+
+
+class LibraryIndex:
+    """
+    The information of every build of the library in one SQLite database at the library root,
+    so that drawing the library takes one query instead of a .blinfo read per build.
+
+    An entry is only trusted while its build folder's mtime didn't change since it was indexed.
+    Since .blinfo files are written through a rename, writing one changes that mtime as well.
+    The .blinfo files stay the source of truth, anything not found here is read from them again.
+    """
+
+    def __init__(self, library_folder: Path):
+        self.library_folder = library_folder
+        self.path = library_folder / INDEX_NAME
+        self.lock = threading.Lock()
+        self.connection: sqlite3.Connection | None = None
+        self.disabled = False
+
+    def _connect(self) -> sqlite3.Connection | None:
+        if self.connection is not None or self.disabled:
+            return self.connection
+
+        try:
+            connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            mode = connection.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+            if mode != "wal":
+                # Network file systems can't share the WAL index, the rollback journal still works there
+                logger.info(f"Library index {self.path} uses the {mode} journal mode")
+            connection.execute("PRAGMA synchronous=NORMAL")
+
+            version = connection.execute("PRAGMA user_version").fetchone()[0]
+            if version != INDEX_VERSION:
+                connection.execute("DROP TABLE IF EXISTS builds")
+                connection.execute(
+                    "CREATE TABLE builds ("
+                    "path TEXT PRIMARY KEY, mtime_ns INTEGER, indexed_ns INTEGER, file_version TEXT, blinfo TEXT"
+                    ")"
+                )
+                connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        except sqlite3.Error as e:
+            logger.warning(f"Library index {self.path} is unavailable, builds are read one by one: {e}")
+            self.disabled = True
+            return None
+
+        self.connection = connection
+        return connection
+
+    def key(self, path: Path) -> str | None:
+        try:
+            return path.relative_to(self.library_folder).as_posix()
+        except ValueError:
+            return None
+
+    def entries(self) -> dict[str, IndexEntry]:
+        """Every entry of the index, by build path relative to the library folder."""
+        with self.lock:
+            connection = self._connect()
+            if connection is None:
+                return {}
+
+            try:
+                rows = connection.execute("SELECT path, mtime_ns, indexed_ns, file_version, blinfo FROM builds")
+                return {
+                    path: IndexEntry(mtime_ns, indexed_ns, file_version, json.loads(blinfo))
+                    for path, mtime_ns, indexed_ns, file_version, blinfo in rows
+                }
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Failed to read library index {self.path}: {e}")
+                return {}
+
+    def put(self, path: Path, build_info: BuildInfo):
+        """Indexes the build at `path`, once its .blinfo was read or written."""
+        key = self.key(path)
+        if key is None:
+            return
+
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            return
+
+        data = build_info.to_dict()
+        with self.lock:
+            connection = self._connect()
+            if connection is None:
+                return
+
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO builds VALUES (?, ?, ?, ?, ?)",
+                    (key, mtime_ns, time.time_ns(), data["file_version"], json.dumps(data["blinfo"][0])),
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to index {path}: {e}")
+
+    def retain(self, folders: Iterable[str | Path], keys: set[str]):
+        """Drops the entries of `folders` that are not in `keys`, like those of deleted builds."""
+        prefixes = tuple(f"{Path(folder).as_posix()}/" for folder in folders)
+        with self.lock:
+            connection = self._connect()
+            if connection is None:
+                return
+
+            try:
+                stale = [
+                    (path,)
+                    for (path,) in connection.execute("SELECT path FROM builds")
+                    if path.startswith(prefixes) and path not in keys
+                ]
+                if stale:
+                    connection.executemany("DELETE FROM builds WHERE path = ?", stale)
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to prune library index {self.path}: {e}")
+
+
+@cache
+def _library_index(library_folder: str) -> LibraryIndex:
+    return LibraryIndex(Path(library_folder))
+
+
+def get_library_index() -> LibraryIndex:
+    return _library_index(os.fspath(get_library_folder()))
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import cache
+from typing import TYPE_CHECKING
+
+from modules._platform import probe_cache_path
+
+if TYPE_CHECKING:
+    import os
+    from pathlib import Path
+
+logger = logging.getLogger()
+
+# Executables remembered at most, least recently used ones are evicted past it
+MAX_PROBE_ENTRIES = 512
+
+
+@dataclass
+class ProbeEntry:
+    size: int
+    mtime_ns: int
+    inode: int
+    output: str
+    last_used: float = field(default_factory=time.time)
+
+    def matches(self, st: os.stat_result) -> bool:
+        return self.size == st.st_size and self.mtime_ns == st.st_mtime_ns and self.inode == st.st_ino
+
+    @classmethod
+    def from_dict(cls, dct: dict):
+        return cls(
+            size=dct["size"],
+            mtime_ns=dct["mtime_ns"],
+            inode=dct["inode"],
+            output=dct["output"],
+            last_used=dct["last_used"],
+        )
+
+    def to_dict(self):
+        return {
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "inode": self.inode,
+            "output": self.output,
+            "last_used": self.last_used,
+        }
+
+
+class ProbeCache:
+    """
+    On-disk cache of the output of `blender -v`, keyed by the executable's path and file identity
+    (size, mtime and inode). Builds of commits that don't touch the code can differ only in the hash
+    and date strings inside the executable, so a file whose identity changed is always probed again.
+    """
+
+    def __init__(self, path: Path | None = None, max_entries=MAX_PROBE_ENTRIES):
+        self.path = path if path is not None else probe_cache_path()
+        self.max_entries = max_entries
+        self.entries: dict[str, ProbeEntry] = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self):
+        if self.loaded:
+            return
+        self.loaded = True
+
+        if not self.path.is_file():
+            return
+
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = {exe: ProbeEntry.from_dict(entry) for exe, entry in data["entries"].items()}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable probe cache {self.path}: {e}")
+            self.entries = {}
+
+    def _save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"entries": {exe: entry.to_dict() for exe, entry in self.entries.items()}}, f)
+        tmp.replace(self.path)
+
+    def _evict(self):
+        excess = len(self.entries) - self.max_entries
+        if excess > 0:
+            for exe, _ in sorted(self.entries.items(), key=lambda item: item[1].last_used)[:excess]:
+                del self.entries[exe]
+
+    def _log_lookup(self, exe: Path, hit: bool):
+        lookups = self.hits + self.misses
+        logger.debug(
+            f"Probe cache {'hit' if hit else 'miss'} for {exe} "
+            f"(hit rate {self.hits / lookups:.0%} over {lookups} lookups)"
+        )
+
+    def get(self, exe: Path) -> str | None:
+        """Returns the known output of `exe -v`, if `exe` was probed before and didn't change since."""
+        key = exe.as_posix()
+        try:
+            st = exe.stat()
+        except OSError:
+            return None
+
+        with self.lock:
+            self._load()
+            entry = self.entries.get(key)
+            if entry is not None and entry.matches(st):
+                entry.last_used = time.time()
+                self.hits += 1
+                self._log_lookup(exe, hit=True)
+                return entry.output
+
+            self.misses += 1
+            self._log_lookup(exe, hit=False)
+        return None
+
+    def put(self, exe: Path, output: str):
+        try:
+            st = exe.stat()
+        except OSError:
+            return
+
+        with self.lock:
+            self._load()
+            self.entries[exe.as_posix()] = ProbeEntry(st.st_size, st.st_mtime_ns, st.st_ino, output)
+            self._evict()
+            try:
+                self._save()
+            except OSError as e:
+                logger.warning(f"Failed to save probe cache {self.path}: {e}")
+
+
+@cache
+def get_probe_cache() -> ProbeCache:
+    return ProbeCache()
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+import os
+import signal
+import threading
+import time
+from collections import deque
+from contextlib import suppress
+from functools import cache
+from subprocess import DEVNULL, PIPE, CalledProcessError, Popen, TimeoutExpired, call
+from typing import TYPE_CHECKING
+
+from modules._platform import get_platform
+from modules.request_metrics import percentile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger()
+
+# Seconds a build gets to print its version before it is killed
+PROBE_TIMEOUT = 30.0
+# Builds probed at once, whatever the worker thread count is
+MAX_CONCURRENT_PROBES = 2
+# Durations remembered for the percentiles
+MAX_DURATION_SAMPLES = 1000
+
+
+class ProbeMetrics:
+    """Statistics of the version probes, gathered from every thread using the ProbeExecutor."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def record(self, duration: float, waited: float, failed=False, timed_out=False):
+        with self.lock:
+            self.probes += 1
+            self.failures += failed or timed_out
+            self.timeouts += timed_out
+            self.durations.append(duration)
+            self.waits.append(waited)
+
+    def summary(self) -> dict:
+        with self.lock:
+            durations = list(self.durations)
+            waits = list(self.waits)
+            return {
+                "probes": self.probes,
+                "failures": self.failures,
+                "timeouts": self.timeouts,
+                "p50_ms": round(percentile(durations, 0.50) * 1000, 1),
+                "p95_ms": round(percentile(durations, 0.95) * 1000, 1),
+                "max_ms": round(max(durations, default=0.0) * 1000, 1),
+                "wait_p95_ms": round(percentile(waits, 0.95) * 1000, 1),
+            }
+
+    def reset(self):
+        with self.lock:
+            self.probes = 0
+            self.failures = 0
+            self.timeouts = 0
+            self.durations: deque[float] = deque(maxlen=MAX_DURATION_SAMPLES)
+            self.waits: deque[float] = deque(maxlen=MAX_DURATION_SAMPLES)
+
+
+def _popen(args: list[str]) -> Popen:
+    """Starts `args` in a process group of its own, so that it can be killed along with its children."""
+    if get_platform() == "Windows":
+        from subprocess import CREATE_NEW_PROCESS_GROUP, CREATE_NO_WINDOW
+
+        return Popen(
+            args,
+            creationflags=CREATE_NO_WINDOW | CREATE_NEW_PROCESS_GROUP,
+            shell=True,
+            stdout=PIPE,
+            stderr=DEVNULL,
+            stdin=DEVNULL,
+        )
+
+    return Popen(args, start_new_session=True, shell=False, stdout=PIPE, stderr=DEVNULL, stdin=DEVNULL)
+
+
+def _kill_group(proc: Popen):
+    if get_platform() == "Windows":
+        from subprocess import CREATE_NO_WINDOW
+
+        # The shell and everything it started
+        call(
+            ["taskkill", "/F", "/T", "/PID", str(proc.pid)],
+            creationflags=CREATE_NO_WINDOW,
+            stdout=DEVNULL,
+            stderr=DEVNULL,
+        )
+        proc.kill()
+        return
+
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        proc.kill()
+
+
+class ProbeExecutor:
+    """
+    Runs `blender -v` for the version probes. At most `max_concurrent` builds run at once and each
+    one is killed, with its whole process group, once it took longer than `timeout` seconds.
+    """
+
+    def __init__(self, timeout=PROBE_TIMEOUT, max_concurrent=MAX_CONCURRENT_PROBES):
+        self.timeout = timeout
+        self.slots = threading.BoundedSemaphore(max_concurrent)
+        self.metrics = ProbeMetrics()
+
+    def probe(self, exe: Path) -> str:
+        """
+        Returns the output of `exe -v`.
+        Raises `subprocess.TimeoutExpired` if it hung and `subprocess.CalledProcessError` if it failed.
+        """
+        args = [exe.as_posix(), "-v"]
+        queued = time.perf_counter()
+
+        with self.slots:
+            start = time.perf_counter()
+            waited = start - queued
+            try:
+                proc = _popen(args)
+            except OSError:
+                self.metrics.record(time.perf_counter() - start, waited, failed=True)
+                raise
+
+            try:
+                stdout, _ = proc.communicate(timeout=self.timeout)
+            except TimeoutExpired:
+                _kill_group(proc)
+                # Reap it, a grandchild outside of the group might still hold the pipe open
+                with suppress(TimeoutExpired):
+                    proc.communicate(timeout=1)
+                duration = time.perf_counter() - start
+                self.metrics.record(duration, waited, timed_out=True)
+                logger.error(f"Killed {exe} after it did not print its version in {self.timeout:.0f}s")
+                self._log_metrics()
+                raise TimeoutExpired(args, self.timeout) from None
+
+        duration = time.perf_counter() - start
+        failed = proc.returncode != 0
+        self.metrics.record(duration, waited, failed=failed)
+        logger.debug(f"Probed {exe} in {duration * 1000:.0f}ms (waited {waited * 1000:.0f}ms)")
+        self._log_metrics()
+        if failed:
+            raise CalledProcessError(proc.returncode, args, stdout)
+        return stdout.decode("UTF-8")
+
+    def _log_metrics(self):
+        logger.debug(f"Version probes: {self.metrics.summary()}")
+
+
+@cache
+def get_probe_executor() -> ProbeExecutor:
+    return ProbeExecutor()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import math
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile of `values`, 0 if there are none."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(math.ceil(p * len(ordered)) - 1, 0)]
+
+
+@dataclass
+class HostMetrics:
+    requests: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    bytes: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def to_dict(self):
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
+            "bytes": self.bytes,
+            "p50_ms": round(percentile(self.latencies, 0.50) * 1000, 1),
+            "p95_ms": round(percentile(self.latencies, 0.95) * 1000, 1),
+        }
+
+
+class RequestMetrics:
+    """Per-host request statistics, gathered from every thread sharing a ConnectionManager."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hosts: dict[str, HostMetrics] = {}
+
+    def record(self, url: str, latency: float, transferred=0, error=False, cache_hit=False):
+        host = urlsplit(url).netloc
+        with self.lock:
+            metrics = self.hosts.setdefault(host, HostMetrics())
+            metrics.requests += 1
+            metrics.latencies.append(latency)
+            metrics.bytes += transferred
+            metrics.errors += error
+            metrics.cache_hits += cache_hit
+
+    @property
+    def requests(self) -> int:
+        with self.lock:
+            return sum(metrics.requests for metrics in self.hosts.values())
+
+    def summary(self) -> dict[str, dict]:
+        with self.lock:
+            return {host: metrics.to_dict() for host, metrics in self.hosts.items()}
+
+    def reset(self):
+        with self.lock:
+            self.hosts.clear()
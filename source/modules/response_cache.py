@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, BinaryIO
+
+from modules._platform import response_cache_path
+from urllib3 import HTTPResponse
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger()
+
+# Bodies kept on disk are capped at this size, least recently used entries are evicted past it
+MAX_CACHE_SIZE = 32 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    etag: str | None
+    last_modified: str | None
+    content_type: str | None
+    size: int
+    last_used: float = field(default_factory=time.time)
+
+    @classmethod
+    def from_dict(cls, dct: dict):
+        return cls(
+            etag=dct["etag"],
+            last_modified=dct["last_modified"],
+            content_type=dct["content_type"],
+            size=dct["size"],
+            last_used=dct["last_used"],
+        )
+
+    def to_dict(self):
+        return {
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "content_type": self.content_type,
+            "size": self.size,
+            "last_used": self.last_used,
+        }
+
+
+class ResponseCache:
+    """
+    On-disk cache of GET responses validated with conditional requests (RFC 7234).
+    Bodies are stored next to an index holding their ETag/Last-Modified validators,
+    a 304 Not Modified answer is then served from the stored body.
+    """
+
+    def __init__(self, path: Path | None = None, max_size=MAX_CACHE_SIZE):
+        self.path = path if path is not None else response_cache_path()
+        self.index_path = self.path / "index.json"
+        self.max_size = max_size
+        self.entries: dict[str, CacheEntry] = {}
+        self.lock = threading.Lock()
+        self.loaded = False
+
+        # Statistics since the last call of `log_stats`
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+
+    def _load(self):
+        # Deferred to the first request so that creating a ConnectionManager stays cheap
+        if self.loaded:
+            return
+        self.loaded = True
+
+        if not self.index_path.is_file():
+            return
+
+        try:
+            with self.index_path.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+            self.entries = {url: CacheEntry.from_dict(entry) for url, entry in index["entries"].items()}
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable response cache {self.index_path}: {e}")
+            self.entries = {}
+
+    def _save(self):
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_suffix(".tmp")
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"entries": {url: entry.to_dict() for url, entry in self.entries.items()}}, f)
+        tmp.replace(self.index_path)
+
+    def _body_path(self, url: str) -> Path:
+        return self.path / hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _remove(self, url: str):
+        self.entries.pop(url, None)
+        self._body_path(url).unlink(missing_ok=True)
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        with self.lock:
+            self._load()
+            entry = self.entries.get(url)
+
+            if entry is None or not self._body_path(url).is_file():
+                return {}
+
+            headers = {}
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+            return headers
+
+    def cached_response(self, url: str) -> HTTPResponse | None:
+        """
+        Returns the stored response for `url` after the server answered 304 Not Modified.
+        Its body is read lazily from disk, so it can be streamed like a network response.
+        """
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+
+            try:
+                body = self._body_path(url).open("rb")
+            except OSError:
+                self._remove(url)
+                return None
+
+            entry.last_used = time.time()
+            self.hits += 1
+            self.bytes_saved += entry.size
+
+        return self.response(url, body, entry.size, entry.content_type)
+
+    @staticmethod
+    def response(url: str, body: BinaryIO, size: int, content_type: str | None = None) -> HTTPResponse:
+        headers = {"content-length": str(size)}
+        if content_type is not None:
+            headers["content-type"] = content_type
+
+        return HTTPResponse(
+            body=body,
+            headers=headers,
+            status=200,
+            preload_content=False,
+            decode_content=False,
+            request_method="GET",
+            request_url=url,
+        )
+
+    def store(self, url: str, r: HTTPResponse) -> bytes | None:
+        """
+        Stores a fresh response, if it carries validators that allow revalidating it later.
+
+        Returns:
+            The body of the response, if it was read to be stored.
+        """
+        etag = r.headers.get("etag")
+        last_modified = r.headers.get("last-modified")
+
+        with self.lock:
+            self.misses += 1
+
+            if r.status != 200 or (etag is None and last_modified is None):
+                return None
+
+        # Read outside of the lock, this may still be downloading
+        body = r.data
+        if body is None or len(body) > self.max_size:
+            return body
+
+        with self.lock:
+            try:
+                self.path.mkdir(parents=True, exist_ok=True)
+                self._body_path(url).write_bytes(body)
+                self.entries[url] = CacheEntry(etag, last_modified, r.headers.get("content-type"), len(body))
+                self._evict()
+                self._save()
+            except OSError as e:
+                logger.warning(f"Failed to cache response of {url}: {e}")
+                self._remove(url)
+
+        return body
+
+    def _evict(self):
+        total = sum(entry.size for entry in self.entries.values())
+        for url, entry in sorted(self.entries.items(), key=lambda item: item[1].last_used):
+            if total <= self.max_size:
+                break
+            total -= entry.size
+            self._remove(url)
+
+    def log_stats(self):
+        """Logs and resets the statistics gathered since the previous call, and persists access times."""
+        with self.lock:
+            if self.hits or self.misses:
+                logger.debug(
+                    f"Response cache: {self.hits} hits, {self.misses} misses, {self.bytes_saved / 1024:.1f} KiB saved"
+                )
+                if self.hits:
+                    try:
+                        self._save()
+                    except OSError as e:
+                        logger.warning(f"Failed to save response cache index: {e}")
+
+            self.hits = 0
+            self.misses = 0
+            self.bytes_saved = 0
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import json
+import logging
+import os
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
 
 from modules.build_info import BuildInfo
 from modules.settings import EPOCH
+from PyQt5.QtCore import QLockFile
 from semver import Version
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger()
+
+# Layout version of the stable cache file, files without one are read as the original layout
+STABLE_CACHE_VERSION = 2
+# Milliseconds to wait for another launcher instance to finish writing a cache file
+CACHE_LOCK_TIMEOUT = 5000
+
 # Template of stable response for reference:
 STABLE_TEMPLATE = """
 <html>
@@ -25,21 +40,66 @@ STABLE_FOLDER_TEMPLATE = """<a href="../">../</a><a href="blender-4.0.0-linux-x6
 """
 
 
+def write_cache(path: Path, data) -> bool:
+    """
+    Writes `data` as JSON to a temporary file next to `path`, then renames it over `path`,
+    so that a crash never leaves a partially written cache behind. A lock file keeps
+    several launcher instances from writing the same cache at once.
+    """
+    lock = QLockFile(f"{path}.lock")
+    if not lock.tryLock(CACHE_LOCK_TIMEOUT):
+        logger.warning(f"Could not lock {path}, another instance is writing it")
+        return False
+
+    try:
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        lock.unlock()
+
+    return True
+
+
 @dataclass
 class StableFolder:
     assets: list[BuildInfo]
     modified_date: datetime
 
+    def is_fresh(self, modified_date: datetime | None) -> bool:
+        """
+        Whether the cached listing can be used for a folder listed with `modified_date`. The release index
+        dates every folder, so old series such as 2.x/3.x are only fetched again once they change.
+        """
+        return modified_date is not None and modified_date == self.modified_date
+
     @classmethod
     def from_dict(cls, dct: dict):
+        return cls(
+            assets=[
+                BuildInfo(link, subversion, build_hash, datetime.fromisoformat(commit_time), branch)
+                for link, subversion, build_hash, commit_time, branch in dct["assets"]
+            ],
+            modified_date=datetime.fromisoformat(dct["modified_date"]),
+        )
+
+    @classmethod
+    def from_v1_dict(cls, dct: dict):
         return cls(
             assets=[BuildInfo.from_dict(link, build["blinfo"][0]) for link, build in dct["assets"]],
             modified_date=datetime.fromisoformat(dct["modified_date"]),
         )
 
     def to_dict(self):
+        # Remote builds never have a custom name, favorite or executable, one row per build is enough
         return {
-            "assets": [(build.link, build.to_dict()) for build in self.assets],
+            "assets": [
+                (build.link, build.subversion, build.build_hash, build.commit_time.isoformat(), build.branch)
+                for build in self.assets
+            ],
             "modified_date": self.modified_date.isoformat(),
         }
 
@@ -47,6 +107,8 @@ class StableFolder:
 @dataclass
 class StableCache:
     folders: dict[Version, StableFolder] = field(default_factory=dict)
+    # Stored folders below the minimum scraped version, kept as they are until they're needed
+    unloaded: dict[str, dict] = field(default_factory=dict)
 
     def __contains__(self, ver: Version) -> bool:
         return ver in self.folders
@@ -59,13 +121,162 @@ class StableCache:
         self.folders[ver] = folder
         return folder
 
+    def is_fresh(self, ver: Version, modified_date: datetime | None) -> bool:
+        return ver in self.folders and self.folders[ver].is_fresh(modified_date)
+
+    def materialize(self, minimum_version: Version):
+        """Builds the folders at or above `minimum_version` that are still unloaded"""
+        for version in list(self.unloaded):
+            ver = Version.parse(version)
+            if ver >= minimum_version:
+                self.folders[ver] = StableFolder.from_dict(self.unloaded.pop(version))
+
+    @classmethod
+    def from_dict(cls, dct: dict, minimum_version: Version):
+        if "version" not in dct:
+            return cls(
+                folders={
+                    Version.parse(version): StableFolder.from_v1_dict(value)
+                    for version, value in dct["folders"].items()
+                },
+            )
+
+        if dct["version"] != STABLE_CACHE_VERSION:
+            logger.warning(f"Unknown stable cache version {dct['version']}, ignoring it")
+            return cls()
+
+        cache = cls(unloaded=dct["folders"])
+        cache.materialize(minimum_version)
+        return cache
+
+    def to_dict(self):
+        folders = dict(self.unloaded)
+        folders.update((str(v), folder.to_dict()) for v, folder in self.folders.items())
+        return {"version": STABLE_CACHE_VERSION, "folders": folders}
+
+    @classmethod
+    def load(cls, path: Path, minimum_version: Version, legacy_path: Path | None = None) -> StableCache:
+        if not path.exists():
+            if legacy_path is None or not legacy_path.exists():
+                return cls()
+            # Starts from the cache of the original layout, which is left as is for older launchers
+            path = legacy_path
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                cache = cls.from_dict(json.load(f), minimum_version)
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.exception(f"Failed to load {path}, starting from an empty cache")
+            return cls()
+
+        logger.debug(f"Loaded cache from {path!r} ({len(cache.folders)} folders, {len(cache.unloaded)} unloaded)")
+        return cache
+
+    def save(self, path: Path) -> bool:
+        return write_cache(path, self.to_dict())
+
+
+@dataclass
+class AutomatedCache:
+    # builder.blender.org branch type ("daily", "experimental", "patch") -> builds last listed there
+    branches: dict[str, list[BuildInfo]] = field(default_factory=dict)
+
+    def builds(self):
+        for builds in self.branches.values():
+            yield from builds
+
+    def update(self, branch_type: str, builds: list[BuildInfo]) -> tuple[list[BuildInfo], list[BuildInfo]]:
+        """
+        Replaces the cached builds of `branch_type`.
+
+        Returns:
+            The (added, removed) builds compared to the previous listing, matched by link.
+        """
+        old = {build.link: build for build in self.branches.get(branch_type, [])}
+        new_links = {build.link for build in builds}
+
+        added = [build for build in builds if build.link not in old]
+        removed = [build for link, build in old.items() if link not in new_links]
+
+        self.branches[branch_type] = builds
+        return added, removed
+
     @classmethod
     def from_dict(cls, dct: dict):
         return cls(
-            folders={
-                Version.parse(version): StableFolder.from_dict(value) for version, value in dct["folders"].items()
+            branches={
+                branch_type: [BuildInfo.from_dict(link, build["blinfo"][0]) for link, build in builds]
+                for branch_type, builds in dct["branches"].items()
             },
         )
 
     def to_dict(self):
-        return {"folders": {str(v): folder.to_dict() for v, folder in self.folders.items()}}
+        return {
+            "branches": {
+                branch_type: [(build.link, build.to_dict()) for build in builds]
+                for branch_type, builds in self.branches.items()
+            }
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> AutomatedCache:
+        if not path.exists():
+            return cls()
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                cache = cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            logger.exception(f"Failed to load {path}, starting from an empty cache")
+            return cls()
+
+        logger.debug(f"Loaded cache from {path!r}")
+        return cache
+
+
+@dataclass
+class LauncherReleaseCache:
+    # Tag the last check found, and whether pre-releases were considered for it
+    latest_tag: str | None = None
+    pre_release: bool = False
+    checked_date: datetime = EPOCH
+    # (tag, asset names) of the GitHub releases list, and its ETag for conditional requests
+    releases: list[tuple[str, list[str]]] = field(default_factory=list)
+    etag: str | None = None
+
+    def is_fresh(self, pre_release: bool, now: datetime, interval: timedelta) -> bool:
+        return self.latest_tag is not None and self.pre_release == pre_release and now - self.checked_date < interval
+
+    @classmethod
+    def from_dict(cls, dct: dict):
+        return cls(
+            latest_tag=dct["latest_tag"],
+            pre_release=dct["pre_release"],
+            checked_date=datetime.fromisoformat(dct["checked_date"]),
+            releases=[(tag, assets) for tag, assets in dct["releases"]],
+            etag=dct["etag"],
+        )
+
+    def to_dict(self):
+        return {
+            "latest_tag": self.latest_tag,
+            "pre_release": self.pre_release,
+            "checked_date": self.checked_date.isoformat(),
+            "releases": self.releases,
+            "etag": self.etag,
+        }
+
+    @classmethod
+    def load(cls, path: Path) -> LauncherReleaseCache:
+        if not path.exists():
+            return cls()
+
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                cache = cls.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.exception(f"Failed to load {path}, starting from an empty cache")
+            return cls()
+
+        logger.debug(f"Loaded cache from {path!r}")
+        return cache
@@ -437,6 +437,14 @@ def set_scrape_automated_builds(b: bool):
     get_settings().setValue("scrape_automated_builds", b)
 
 
+def get_show_cached_stable_builds_first() -> bool:
+    return get_settings().value("show_cached_stable_builds_first", defaultValue=True, type=bool)
+
+
+def set_show_cached_stable_builds_first(b: bool):
+    get_settings().setValue("show_cached_stable_builds_first", b)
+
+
 def get_make_error_popup():
     return get_settings().value("error_popup", defaultValue=True, type=bool)
 
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, replace
+from threading import Lock
+from typing import TYPE_CHECKING
+
+from modules.library_index import get_library_index
+from modules.task import Task
+from PyQt5.QtCore import QObject, QTimer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from modules.build_info import BuildInfo
+    from modules.tasks import TaskQueue
+
+logger = logging.getLogger()
+
+# Milliseconds without any new change to a build before its .blinfo is written
+WRITE_DELAY = 500
+
+
+class BuildInfoWriter(QObject):
+    """
+    Writes the .blinfo files of edited builds back to the library. Changes made within `WRITE_DELAY`
+    of each other are coalesced, so that a build is written once with its latest state however many
+    times it was renamed or (un)favorited, and `flush` writes whatever is left when quitting.
+    """
+
+    def __init__(self, task_queue: TaskQueue, parent=None):
+        super().__init__(parent)
+        self.task_queue = task_queue
+        self.pending: dict[Path, BuildInfo] = {}
+        self.pending_lock = Lock()
+        # Held while writing, so that older states never land after newer ones
+        self.write_lock = Lock()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(WRITE_DELAY)
+        self.timer.timeout.connect(self.flush_later)
+
+    def schedule(self, path: Path, build_info: BuildInfo):
+        # A copy, the widgets keep editing theirs while the write waits on the task queue
+        snapshot = replace(build_info)
+        with self.pending_lock:
+            self.pending[path] = snapshot
+        self.timer.start()
+
+    def write_now(self, path: Path, build_info: BuildInfo):
+        """Writes the build right away, for callers that read it back at once."""
+        with self.write_lock:
+            with self.pending_lock:
+                self.pending.pop(path, None)
+            build_info.write_to(path)
+            get_library_index().put(path, build_info)
+
+    def flush_later(self):
+        self.task_queue.append(FlushBuildInfoTask(self))
+
+    def close(self):
+        """Writes the pending changes before quitting."""
+        self.timer.stop()
+        self.flush()
+
+    def flush(self):
+        with self.write_lock:
+            with self.pending_lock:
+                pending, self.pending = self.pending, {}
+
+            for path, build_info in pending.items():
+                self._write(path, build_info)
+
+            if pending:
+                logger.debug(f"Wrote {len(pending)} .blinfo files")
+
+    def _write(self, path: Path, build_info: BuildInfo):
+        try:
+            build_info.write_to(path)
+        except OSError as e:
+            logger.error(f"Failed to write {path / '.blinfo'}: {e}")
+            return
+        get_library_index().put(path, build_info)
+
+
+@dataclass(frozen=True)
+class FlushBuildInfoTask(Task):
+    writer: BuildInfoWriter
+
+    def run(self):
+        self.writer.flush()
+
+    def __str__(self):
+        return "Write build information"
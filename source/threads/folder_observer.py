@@ -1,37 +1,372 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import threading
+import time
+from contextlib import suppress
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+from modules._platform import get_platform
+from PyQt5.QtCore import QThread, pyqtSignal
+from threads.library_drawer import blender_exe_name
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger()
+
+# Seconds a build, and everything in it, has to stay untouched before it is reported, so that
+# extractions and copies in progress are only reported once they are done
+SETTLE_TIME = 2.0
+# Seconds a folder stays paused at most, in case whatever paused it never resumes it
+MAX_PAUSE = 600.0
+# Bounds of the interval of the polling fallback, doubled after every scan that found nothing new
+MIN_POLL_INTERVAL = 2.0
+MAX_POLL_INTERVAL = 60.0
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Builds appearing and disappearing in a branch folder, or the branch folder itself going away
+BRANCH_MASK = IN_CREATE | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR
+# Files of a build written in place or renamed into it, such as its .blinfo or executable
+BUILD_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_ONLYDIR
+# Branch folders created after the watch started
+ROOT_MASK = IN_CREATE | IN_MOVED_TO | IN_ONLYDIR
+
+_event = struct.Struct("iIII")
+
+
+class Inotify:
+    """The few inotify calls of libc the observer needs, through ctypes."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.libc.inotify_add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+
+    def add_watch(self, path: Path, mask: int) -> int:
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()), str(path))
+        return wd
+
+    def rm_watch(self, wd: int):
+        self.libc.inotify_rm_watch(self.fd, wd)
+
+    def read_events(self):
+        """Yields (wd, mask, name) for every queued event."""
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = _event.unpack_from(data, offset)
+            offset += _event.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            yield wd, mask, name
+
+    def close(self):
+        os.close(self.fd)
+
+
+def newest_mtime_ns(path: Path) -> int:
+    """The newest mtime of `path` and of everything under it, which moves as long as anything is written there"""
+    newest = 0
+    folders = [path]
+    while folders:
+        folder = folders.pop()
+        try:
+            with os.scandir(folder) as it:
+                newest = max(newest, os.stat(folder).st_mtime_ns)
+                for entry in it:
+                    with suppress(OSError):
+                        newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                        if entry.is_dir(follow_symlinks=False):
+                            folders.append(Path(entry.path))
+        except OSError:
+            pass
+    return newest
+
+
+class PausedFolders:
+    """
+    Branch folders the launcher is writing a build into, such as a download being extracted, renamed
+    and read. Their builds are only reported once the launcher is done with them and drew them itself.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.folders: dict[Path, list[float]] = {}
+
+    def pause(self, folder: Path):
+        with self.lock:
+            self.folders.setdefault(Path(folder), []).append(time.monotonic())
+
+    def resume(self, folder: Path):
+        with self.lock:
+            starts = self.folders.get(Path(folder))
+            if starts:
+                starts.pop(0)
+                if not starts:
+                    del self.folders[Path(folder)]
+
+    def __contains__(self, folder: Path) -> bool:
+        now = time.monotonic()
+        with self.lock:
+            return any(now - start < MAX_PAUSE for start in self.folders.get(folder, ()))
 
-from PyQt5.QtCore import QThread
+
+def scan_builds(branch: Path) -> dict[Path, int]:
+    """The build folders of a branch folder, with their mtimes"""
+    builds = {}
+    try:
+        with os.scandir(branch) as it:
+            for entry in it:
+                if entry.is_dir():
+                    with suppress(OSError):
+                        builds[branch / entry.name] = entry.stat().st_mtime_ns
+    except OSError:
+        pass
+    return builds
 
 
 class FolderObserver(QThread):
-    def __init__(self, parent, folder):
+    """
+    Watches the branch folders of the library for builds added, removed or edited outside of the
+    launcher. Builds are reported once they settled, sorted out like `DrawLibraryTask` does: `found`
+    when their folder holds a .blinfo or a Blender executable, `unrecognized` when it holds neither
+    and `removed` when it is gone, for the library to draw, redraw or drop them.
+
+    Uses inotify on Linux. Elsewhere, or when inotify is unavailable, the folders are scanned
+    at an interval that grows while nothing changes.
+    """
+
+    found = pyqtSignal(Path)
+    unrecognized = pyqtSignal(Path)
+    removed = pyqtSignal(Path)
+
+    def __init__(
+        self,
+        library_folder: Path,
+        folders: Iterable[str] = ("stable", "daily", "experimental", "custom"),
+        paused: PausedFolders | None = None,
+    ):
         QThread.__init__(self)
-        self.parent = parent
-        self.folder = Path(folder)
+        self.library_folder = Path(library_folder)
+        self.folders = tuple(folders)
+        self.paused = paused if paused is not None else PausedFolders()
+        self.blender_exe = blender_exe_name()
+        self.stop_event = threading.Event()
+        # Wakes the inotify loop up when stopping
+        self.stop_lock = threading.Lock()
+        self.stop_r, self.stop_w = -1, -1
+        # Builds waiting to settle, with the time they may be reported at
+        self.pending: dict[Path, float] = {}
+
+    def stop(self):
+        self.stop_event.set()
+        with self.stop_lock:
+            if self.stop_w >= 0:
+                os.write(self.stop_w, b"\0")
 
     def run(self):
-        subfolders = self.get_subfolders()
-
-        while self.parent:
-            new_subfolders = self.get_subfolders()
-
-            if subfolders != new_subfolders:
-                if len(new_subfolders) > len(subfolders):
-                    for sub in new_subfolders:
-                        if sub not in subfolders:
-                            print("New -> " + sub)
-                elif len(new_subfolders) < len(subfolders):
-                    for sub in subfolders:
-                        if sub not in new_subfolders:
-                            print("Deleted -> " + sub)
+        if get_platform() == "Linux":
+            self.stop_r, self.stop_w = os.pipe()
+
+        try:
+            if self.stop_r >= 0:
+                try:
+                    inotify = Inotify()
+                except (OSError, AttributeError) as e:
+                    logger.warning(f"inotify is unavailable, the library is polled instead: {e}")
                 else:
-                    for sub in new_subfolders:
-                        if sub not in subfolders:
-                            print("Changed -> " + sub)
+                    try:
+                        self.watch(inotify)
+                    finally:
+                        inotify.close()
+                    return
+
+            self.poll()
+        finally:
+            with self.stop_lock:
+                if self.stop_r >= 0:
+                    os.close(self.stop_r)
+                    os.close(self.stop_w)
+                    self.stop_r, self.stop_w = -1, -1
+
+    def report(self, build: Path):
+        if not build.is_dir():
+            self.removed.emit(build)
+        elif (build / ".blinfo").is_file() or (build / self.blender_exe).is_file():
+            self.found.emit(build)
+        else:
+            self.unrecognized.emit(build)
+
+    def is_settled(self, build: Path) -> bool:
+        if build.parent in self.paused:
+            return False
+        # Only the build folder itself is watched, a copy can go on writing deep inside of it for a while
+        return not build.is_dir() or time.time_ns() - newest_mtime_ns(build) >= SETTLE_TIME * 1e9
+
+    def report_settled(self) -> float | None:
+        """Reports the builds that settled, returns the seconds until the next one does."""
+        now = time.monotonic()
+        for build, deadline in list(self.pending.items()):
+            if deadline <= now:
+                if not self.is_settled(build):
+                    self.pending[build] = now + SETTLE_TIME
+                    continue
+                del self.pending[build]
+                self.report(build)
+
+        if not self.pending:
+            return None
+        return max(min(self.pending.values()) - now, 0.0)
+
+    def watch(self, inotify: Inotify):
+        branches: dict[int, Path] = {}
+        builds: dict[int, Path] = {}
+        watched_builds: dict[Path, int] = {}
+
+        def watch_build(build: Path):
+            try:
+                wd = inotify.add_watch(build, BUILD_MASK)
+            except OSError:
+                return
+            builds[wd] = build
+            watched_builds[build] = wd
+
+        def watch_branch(branch: Path):
+            try:
+                branches[inotify.add_watch(branch, BRANCH_MASK)] = branch
+            except OSError:
+                return
+            for build in scan_builds(branch):
+                watch_build(build)
+
+        def rescan():
+            known = set(watched_builds)
+            current = set()
+            for branch in branches.values():
+                current |= set(scan_builds(branch))
+            for build in current - known:
+                watch_build(build)
+            for build in known - current:
+                builds.pop(watched_builds.pop(build), None)
+            for build in known ^ current:
+                self.pending[build] = time.monotonic() + SETTLE_TIME
+
+        try:
+            root_wd = inotify.add_watch(self.library_folder, ROOT_MASK)
+        except OSError as e:
+            logger.warning(f"Can't watch {self.library_folder}: {e}")
+            return
+
+        for folder in self.folders:
+            watch_branch(self.library_folder / folder)
+
+        poller = select.poll()
+        poller.register(inotify.fd, select.POLLIN)
+        poller.register(self.stop_r, select.POLLIN)
+
+        while not self.stop_event.is_set():
+            timeout = self.report_settled()
+            # Sleeps until something happens while nothing is pending
+            ready = poller.poll(None if timeout is None else timeout * 1000)
+            if not ready:
+                continue
+
+            for wd, mask, name in inotify.read_events():
+                if mask & IN_Q_OVERFLOW:
+                    logger.warning("Library watch queue overflowed, scanning the library again")
+                    rescan()
+                elif wd == root_wd:
+                    if name in self.folders and mask & IN_ISDIR:
+                        branch = self.library_folder / name
+                        watch_branch(branch)
+                        for build in scan_builds(branch):
+                            self.pending[build] = time.monotonic() + SETTLE_TIME
+                elif wd in branches:
+                    if mask & (IN_DELETE_SELF | IN_MOVE_SELF | IN_IGNORED):
+                        branch = branches.pop(wd)
+                        for build in [build for build in watched_builds if build.parent == branch]:
+                            builds.pop(watched_builds.pop(build), None)
+                            self.pending[build] = time.monotonic() + SETTLE_TIME
+                    elif mask & IN_ISDIR and name:
+                        build = branches[wd] / name
+                        if mask & (IN_CREATE | IN_MOVED_TO) and build not in watched_builds:
+                            watch_build(build)
+                        elif mask & (IN_DELETE | IN_MOVED_FROM) and build in watched_builds:
+                            wd_ = watched_builds.pop(build)
+                            builds.pop(wd_, None)
+                            if mask & IN_MOVED_FROM:
+                                inotify.rm_watch(wd_)
+                        self.pending[build] = time.monotonic() + SETTLE_TIME
+                elif wd in builds:
+                    if mask & IN_IGNORED:
+                        build = builds.pop(wd)
+                        watched_builds.pop(build, None)
+                    else:
+                        # Copies in progress keep pushing the report back until they are done
+                        self.pending[builds[wd]] = time.monotonic() + SETTLE_TIME
+
+    def poll(self):
+        def scan() -> dict[Path, int]:
+            builds: dict[Path, int] = {}
+            for folder in self.folders:
+                builds.update(scan_builds(self.library_folder / folder))
+            return builds
+
+        snapshot = scan()
+        interval = MIN_POLL_INTERVAL
+        next_scan = time.monotonic() + interval
+
+        while True:
+            wait = next_scan - time.monotonic()
+            settle = self.report_settled()
+            if settle is not None:
+                wait = min(wait, settle)
+            if self.stop_event.wait(max(wait, 0.0)):
+                return
+            if time.monotonic() < next_scan:
+                continue
 
-                subfolders = new_subfolders
+            # A .blinfo renamed into place moves the mtime of its build folder as well
+            current = scan()
+            differences = {
+                build for build in snapshot.keys() | current.keys() if snapshot.get(build) != current.get(build)
+            }
+            snapshot = current
 
-            QThread.sleep(3)
+            for build in differences:
+                self.pending[build] = time.monotonic() + SETTLE_TIME
 
-    def get_subfolders(self):
-        return [sub.name for sub in self.folder.iterdir() if sub.is_dir()]
+            if differences or self.pending:
+                interval = MIN_POLL_INTERVAL
+            else:
+                interval = min(interval * 2, MAX_POLL_INTERVAL)
+            next_scan = time.monotonic() + interval
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from modules._platform import get_platform
+from modules.build_info import BuildInfo
+from modules.library_index import get_library_index
 from modules.settings import get_library_folder
 from modules.task import Task
 from PyQt5.QtCore import pyqtSignal
@@ -12,34 +16,107 @@ from PyQt5.QtCore import pyqtSignal
 if TYPE_CHECKING:
     from collections.abc import Iterable
 
+    from modules.library_index import IndexEntry
+
+# Builds delivered to the GUI thread at once
+BATCH_SIZE = 100
+
+
+class ScannedFolder(NamedTuple):
+    # Recognized builds, with their information when the library index had it
+    found: list[tuple[Path, BuildInfo | None]]
+    unrecognized: list[Path]
+    keys: set[str]
+
+
+def blender_exe_name() -> str:
+    return {
+        "Windows": "blender.exe",
+        "Linux": "blender",
+        "macOS": "Blender/Blender.app/Contents/MacOS/Blender",
+    }.get(get_platform(), "blender")
+
+
+def scan_folder(path: Path, folder: str, entries: dict[str, IndexEntry], blender_exe: str) -> ScannedFolder | None:
+    """
+    Sorts the builds of a branch folder out with one directory read, using the file types it returns.
+    Returns None when the folder can't be read.
+    """
+    result = ScannedFolder([], [], set())
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return None
+
+    with it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+
+            build = path / entry.name
+            key = f"{folder}/{entry.name}"
+            result.keys.add(key)
+
+            indexed = entries.get(key)
+            if indexed is not None:
+                try:
+                    valid = indexed.is_valid(entry.stat().st_mtime_ns, BuildInfo.file_version)
+                except OSError:
+                    valid = False
+                if valid:
+                    result.found.append((build, BuildInfo.from_dict(build.as_posix(), indexed.blinfo)))
+                    continue
+
+            if os.path.isfile(os.path.join(entry.path, ".blinfo")) or os.path.isfile(
+                os.path.join(entry.path, blender_exe)
+            ):
+                result.found.append((build, None))
+            else:
+                result.unrecognized.append(build)
+
+    return result
+
 
 @dataclass(frozen=True)
 class DrawLibraryTask(Task):
     folders: Iterable[str | Path] = ("stable", "daily", "experimental", "custom")
-    found = pyqtSignal(Path)
-    unrecognized = pyqtSignal(Path)
+    # Batches of list[tuple[Path, BuildInfo | None]], the build information is there when it was indexed
+    found = pyqtSignal(list)
+    # Batches of list[Path]
+    unrecognized = pyqtSignal(list)
     finished = pyqtSignal()
 
     def run(self):
         library_folder = Path(get_library_folder())
-        platform = get_platform()
-
-        blender_exe = {
-            "Windows": "blender.exe",
-            "Linux": "blender",
-            "macOS": "Blender/Blender.app/Contents/MacOS/Blender",
-        }.get(platform, "blender")
-
-        for folder in self.folders:
-            path = library_folder / folder
-
-            if path.is_dir():
-                for build in path.iterdir():
-                    if build.is_dir():
-                        if (folder / build / ".blinfo").is_file() or (path / build / blender_exe).is_file():
-                            self.found.emit(folder / build)
-                        else:
-                            self.unrecognized.emit(folder / build)
+        blender_exe = blender_exe_name()
+        folders = [Path(folder).as_posix() for folder in self.folders]
+
+        # Builds whose folder didn't change since they were indexed are drawn without reading their .blinfo
+        index = get_library_index()
+        entries = index.entries()
+        seen: set[str] = set()
+        scanned = list(folders)
+
+        # Branch folders are read concurrently, which hides most of the latency of network mounts
+        with ThreadPoolExecutor(max_workers=max(len(folders), 1)) as executor:
+            scans = [
+                executor.submit(scan_folder, library_folder / folder, folder, entries, blender_exe)
+                for folder in folders
+            ]
+            for folder, scan in zip(folders, scans):
+                result = scan.result()
+                if result is None:
+                    # Keep the index of a folder that is only unreachable for now
+                    scanned.remove(folder)
+                    continue
+
+                seen |= result.keys
+                for i in range(0, len(result.found), BATCH_SIZE):
+                    self.found.emit(result.found[i : i + BATCH_SIZE])
+                for i in range(0, len(result.unrecognized), BATCH_SIZE):
+                    self.unrecognized.emit(result.unrecognized[i : i + BATCH_SIZE])
+
+        index.retain(scanned, seen)
         self.finished.emit()
 
     def __str__(self):
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from modules.build_info import BuildInfo, read_blender_version, version_tuple
+from modules.library_index import get_library_index
+from modules.settings import get_library_folder
+from modules.task import Task
+from PyQt5.QtCore import pyqtSignal
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+logger = logging.getLogger()
+
+# Builds read again at once, when their .blinfo is too old to be upgraded from its own data
+MIGRATION_CONCURRENCY = 4
+
+# `BuildInfo.to_dict` writes the file version first, so it's found in the first bytes of a .blinfo
+_file_version = re.compile(rb'"file_version":\s*"([^"]*)"')
+
+
+def blinfo_file_version(blinfo: Path) -> str | None:
+    with blinfo.open("rb") as f:
+        m = _file_version.search(f.read(64))
+    if m is not None:
+        return m.group(1).decode("utf-8")
+
+    with blinfo.open(encoding="utf-8") as f:
+        return json.load(f).get("file_version")
+
+
+@dataclass(frozen=True)
+class MigrateLibraryTask(Task):
+    """
+    Brings every .blinfo of the library to the current `BuildInfo.file_version` before the library is drawn.
+    Files recent enough are rewritten from their own data, the others are read again from their build,
+    several at once.
+    """
+
+    folders: Iterable[str] = ("stable", "daily", "experimental", "custom")
+    progress = pyqtSignal(int, int)
+    finished = pyqtSignal()
+
+    def run(self):
+        # The library is only drawn once this finishes, whatever happens
+        try:
+            self.migrate()
+        finally:
+            self.finished.emit()
+
+    def migrate(self):
+        outdated = self.outdated_builds()
+        if not outdated:
+            return
+
+        start_time = perf_counter()
+        total = len(outdated)
+        done = 0
+        lock = Lock()
+        self.progress.emit(done, total)
+
+        def step():
+            nonlocal done
+            with lock:
+                done += 1
+                self.progress.emit(done, total)
+
+        min_version = version_tuple(BuildInfo.min_upgradable_file_version)
+        to_read: list[tuple[Path, BuildInfo]] = []
+        for path, data in outdated:
+            try:
+                build_info = BuildInfo.from_dict(path.as_posix(), data["blinfo"][0])
+            except (KeyError, IndexError, TypeError, ValueError):
+                # Left for the library to report as damaged
+                step()
+                continue
+
+            if version_tuple(data.get("file_version")) >= min_version:
+                try:
+                    build_info.write_to(path)
+                except OSError as e:
+                    logger.error(f"Failed to upgrade {path / '.blinfo'}: {e}")
+                step()
+            else:
+                to_read.append((path, build_info))
+
+        def read(build: tuple[Path, BuildInfo]):
+            path, build_info = build
+            try:
+                read_blender_version(path, build_info).write_to(path)
+            # However a build fails, the others are migrated and the library is drawn after them
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Failed to read {path} again: {e}")
+            step()
+
+        with ThreadPoolExecutor(max_workers=MIGRATION_CONCURRENCY) as executor:
+            list(executor.map(read, to_read))
+
+        logger.info(
+            f"Migrated {total} .blinfo files to version {BuildInfo.file_version} in {perf_counter() - start_time:.2f}s "
+            f"({total - len(to_read)} from their data, {len(to_read)} read again)"
+        )
+
+    def outdated_builds(self) -> list[tuple[Path, dict]]:
+        library_folder = Path(get_library_folder())
+        # Builds indexed since their folder last changed are current, their .blinfo isn't opened at all
+        index = get_library_index()
+        entries = index.entries()
+        current_version = version_tuple(BuildInfo.file_version)
+        outdated = []
+
+        for folder in self.folders:
+            path = library_folder / folder
+            try:
+                it = os.scandir(path)
+            except OSError:
+                continue
+
+            with it:
+                for entry in it:
+                    if not entry.is_dir():
+                        continue
+
+                    build = path / entry.name
+                    blinfo = build / ".blinfo"
+                    try:
+                        indexed = entries.get(index.key(build))
+                        if indexed is not None and indexed.is_valid(entry.stat().st_mtime_ns, BuildInfo.file_version):
+                            continue
+                        if not blinfo.is_file():
+                            continue
+                        file_version = blinfo_file_version(blinfo)
+                        # Files written by a newer launcher are left as they are rather than downgraded
+                        if file_version == BuildInfo.file_version or version_tuple(file_version) > current_version:
+                            continue
+                        with blinfo.open(encoding="utf-8") as f:
+                            outdated.append((build, json.load(f)))
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"Skipping unreadable {blinfo}: {e}")
+
+        return outdated
+
+    def __str__(self):
+        return f"Migrate build information of {self.folders}"
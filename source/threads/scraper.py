@@ -1,34 +1,70 @@
 from __future__ import annotations
 
 import distro
-import contextlib
 import json
 import logging
 import re
-from datetime import datetime, timezone
-from itertools import chain
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING
+from queue import Empty, Queue
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Callable, TypeVar
 from urllib.parse import urljoin
 
 import semver
-from bs4 import BeautifulSoup, SoupStrainer
-from modules._platform import get_platform, reset_locale, set_locale, stable_cache_path
+from modules._platform import (
+    automated_cache_path,
+    get_platform,
+    launcher_cache_path,
+    legacy_stable_cache_path,
+    stable_cache_path,
+)
+from modules.autoindex import AutoindexEntry, parse_autoindex
 from modules.build_info import BuildInfo, parse_blender_ver
-from modules.scraper_cache import StableCache
+from modules.date_parsing import parse_http_date
+from modules.scraper_cache import AutomatedCache, LauncherReleaseCache, StableCache, write_cache
 from modules.settings import (
     get_minimum_blender_stable_version,
     get_scrape_automated_builds,
     get_scrape_stable_builds,
+    get_show_cached_stable_builds_first,
     get_use_pre_release_builds,
 )
 from PyQt5.QtCore import QThread, pyqtSignal
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from modules.connection_manager import ConnectionManager
+    from semver import Version
+    from urllib3 import HTTPResponse
 
 logger = logging.getLogger()
 
+# Seconds a check waits for each source before giving up on it, so that a slow host
+# (usually download.blender.org) doesn't hold back the results of the others
+SOURCE_TIMEOUTS = {
+    "stable": 120,
+    "automated": 60,
+    "launcher": 30,
+}
+DEFAULT_SOURCE_TIMEOUT = 60
+
+# Minimum time between two lookups of the launcher's latest release,
+# the unauthenticated GitHub API only allows 60 requests per hour
+LAUNCHER_RECHECK_INTERVAL = timedelta(hours=1)
+
+# Scraped builds are sent to the GUI thread once a batch holds BATCH_SIZE builds
+# or is BATCH_INTERVAL seconds old, whichever comes first
+BATCH_SIZE = 50
+BATCH_INTERVAL = 0.016
+
+JSON_CHUNK_SIZE = 64 * 1024
+LISTING_CHUNK_SIZE = 16 * 1024
+
+_T = TypeVar("_T")
+
 
 def get_latest_tag(
     connection_manager: ConnectionManager,
@@ -48,18 +84,47 @@ def get_latest_tag(
     return tag
 
 
-def get_latest_pre_release_tag(
+def get_launcher_releases(
     connection_manager: ConnectionManager,
     url,
-) -> str | None:
-    r = connection_manager.request("GET", url)
+    cache: LauncherReleaseCache,
+) -> list[tuple[str, list[str]]] | None:
+    """
+    Returns the (tag, asset names) of the GitHub releases at `url`, revalidating the ones held by `cache`
+    with a conditional request. Only those fields are kept from the response, which is decoded as it streams.
+    """
+    headers = {"if-none-match": cache.etag} if cache.etag is not None and cache.releases else None
+    r = connection_manager.request("GET", url, headers=headers, preload_content=False)
 
     if r is None:
         return None
 
     try:
-        parsed_data = json.loads(r.data)
-    except json.JSONDecodeError:
+        if r.status == 304:
+            return cache.releases
+        if r.status != 200:
+            return None
+
+        releases = [(release["tag_name"], [asset["name"] for asset in release["assets"]]) for release in read_json(r)]
+    except (ValueError, KeyError, TypeError):
+        return None
+    finally:
+        r.release_conn()
+        r.close()
+
+    cache.releases = releases
+    cache.etag = r.headers.get("etag")
+    return releases
+
+
+def get_latest_pre_release_tag(
+    connection_manager: ConnectionManager,
+    url,
+    cache: LauncherReleaseCache | None = None,
+) -> str | None:
+    releases = get_launcher_releases(connection_manager, url, cache if cache is not None else LauncherReleaseCache())
+
+    if releases is None:
         return None
 
     platform = get_platform()
@@ -75,13 +140,11 @@ def get_latest_pre_release_tag(
                 platform = "Ubuntu"
                 break
 
-    parsed_data = json.loads(r.data)
-    platform_valid_tags = []
-
-    for release in parsed_data:
-        for asset in release["assets"]:
-            if asset["name"].endswith(".zip") and platform.lower() in asset["name"].lower():
-                platform_valid_tags.append(release["tag_name"])
+    platform_valid_tags = [
+        tag
+        for tag, assets in releases
+        if any(name.endswith(".zip") and platform.lower() in name.lower() for name in assets)
+    ]
 
     pre_release_tags = [release.lstrip("v") for release in platform_valid_tags]
     valid_pre_release_tags = [tag for tag in pre_release_tags if semver.VersionInfo.is_valid(tag)]
@@ -90,17 +153,105 @@ def get_latest_pre_release_tag(
         tag = max(valid_pre_release_tags, key=semver.VersionInfo.parse)
         return f"v{tag}"
 
-    r.release_conn()
-    r.close()
-
     return None
 
 
+def read_json(r: HTTPResponse):
+    """
+    Decodes the JSON body of a response requested with `preload_content=False`. The body is read
+    in chunks as it arrives, then decoded at once, json.loads is faster than any incremental decoding.
+    """
+    return json.loads(b"".join(r.stream(JSON_CHUNK_SIZE)))
+
+
+def merge_sources(
+    sources: dict[str, Callable[[], Iterable[_T]]],
+    timeouts: dict[str, float],
+    on_idle: Callable[[], None] | None = None,
+    running: dict[str, Future] | None = None,
+    completed: set[str] | None = None,
+) -> Iterator[tuple[str, _T]]:
+    """
+    Runs every source in its own thread and yields (source name, item) pairs as soon as any of them produces one.
+    A source still running after its timeout (in seconds) is no longer waited for, and its later items are dropped.
+    `on_idle` is called whenever no item arrived for BATCH_INTERVAL.
+
+    Sources that ran to their end within their timeout are added to `completed`. The others finish in the
+    background, so that they still save their caches for the next call. `running` keeps track of them
+    across calls: a source is only started again once its previous run ended, so that two runs never
+    scrape, or save the cache of, the same source at once.
+    """
+    queue: Queue[tuple[str, object]] = Queue()
+    done = object()
+    failed = object()
+
+    def produce(name: str, source: Callable[[], Iterable[_T]], previous: Future | None):
+        if previous is not None and not previous.done():
+            logger.debug(f"Waiting for the previous {name} scrape to end")
+            wait([previous])
+
+        try:
+            for item in source():
+                queue.put((name, item))
+        except Exception:
+            logger.exception(f"Failed to scrape {name} builds")
+            queue.put((name, failed))
+        else:
+            queue.put((name, done))
+
+    if not sources:
+        return
+
+    if running is None:
+        running = {}
+
+    start_time = monotonic()
+    pending = set(sources)
+    executor = ThreadPoolExecutor(max_workers=len(sources))
+    for name, source in sources.items():
+        running[name] = executor.submit(produce, name, source, running.get(name))
+
+    try:
+        while pending:
+            deadline = min(start_time + timeouts.get(name, DEFAULT_SOURCE_TIMEOUT) for name in pending)
+            timeout = max(deadline - monotonic(), 0)
+            if on_idle is not None:
+                timeout = min(timeout, BATCH_INTERVAL)
+
+            try:
+                name, item = queue.get(timeout=timeout)
+            except Empty:
+                if on_idle is not None:
+                    on_idle()
+
+                for name in list(pending):
+                    timeout = timeouts.get(name, DEFAULT_SOURCE_TIMEOUT)
+                    if start_time + timeout <= monotonic():
+                        logger.warning(f"Stopped waiting for {name} builds after {timeout}s")
+                        pending.discard(name)
+                continue
+
+            if name not in pending:
+                continue
+            if item is done or item is failed:
+                pending.discard(name)
+                if item is done and completed is not None:
+                    completed.add(name)
+                continue
+
+            yield name, item  # type: ignore
+    finally:
+        # Sources that timed out finish in the background
+        executor.shutdown(wait=False)
+
+
 class Scraper(QThread):
-    links = pyqtSignal(BuildInfo)
+    links = pyqtSignal(list)  # list[BuildInfo]
+    removed = pyqtSignal(BuildInfo)
     new_bl_version = pyqtSignal(str)
     error = pyqtSignal()
     stable_error = pyqtSignal(str)
+    check_metrics = pyqtSignal(float, int)  # duration in seconds, request count
 
     def __init__(self, parent, man):
         QThread.__init__(self)
@@ -108,15 +259,20 @@ class Scraper(QThread):
         self.manager: ConnectionManager = man
         self.platform = get_platform()
 
+        # Loaded by the first stable scrape, on the scraper's thread
         self.cache_path = stable_cache_path()
+        self.legacy_cache_path = legacy_stable_cache_path()
+        self.cache: StableCache | None = None
+        # The last run of every source, which may outlive the check that started it
+        self.running_sources: dict[str, Future] = {}
+        # Sources of the last check that timed out or failed, whose rows are kept as they were
+        self.incomplete_sources: set[str] = set()
 
-        if self.cache_path.exists():
-            with stable_cache_path().open("r", encoding="utf-8") as f:
-                cache = json.load(f)
-                self.cache = StableCache.from_dict(cache)
-                logging.debug(f"Loaded cache from {self.cache_path!r}")
-        else:
-            self.cache = StableCache()
+        self.automated_cache_path = automated_cache_path()
+        self.automated_cache = AutomatedCache.load(self.automated_cache_path)
+
+        self.launcher_cache_path = launcher_cache_path()
+        self.launcher_cache = LauncherReleaseCache.load(self.launcher_cache_path)
 
         self.json_platform = {
             "Windows": "windows",
@@ -139,45 +295,160 @@ class Scraper(QThread):
         self.scrape_automated = get_scrape_automated_builds()
 
     def run(self):
-        self.get_download_links()
+        self.manager.metrics.reset()
+        start_time = perf_counter()
+
+        self.get_download_links(check_launcher_version=True)
+
+        duration = perf_counter() - start_time
+        hosts = self.manager.metrics.summary()
+        logger.debug(f"Check metrics: {json.dumps({'duration_s': round(duration, 3), 'hosts': hosts})}")
+        self.check_metrics.emit(duration, self.manager.metrics.requests)
 
-        if get_use_pre_release_builds():
+        self.manager.cache.log_stats()
+        # Sources that timed out may still be using the pool
+        if all(future.done() for future in self.running_sources.values()):
+            self.manager.manager.clear()
+
+    def get_download_links(self, check_launcher_version=False):
+        sources = {}
+        if self.scrape_stable:
+            sources["stable"] = self.scrap_stable_releases
+        if self.scrape_automated:
+            sources["automated"] = self.scrape_automated_releases
+        if check_launcher_version:
+            sources["launcher"] = self.scrape_launcher_version
+
+        # Builds are delivered in batches so that the GUI thread is woken up, and its lists sorted,
+        # once per batch rather than once per build
+        batch: list[BuildInfo] = []
+        batch_start = monotonic()
+
+        def flush():
+            nonlocal batch, batch_start
+            if batch:
+                self.links.emit(batch)
+                batch = []
+            batch_start = monotonic()
+
+        def flush_if_due():
+            if monotonic() - batch_start >= BATCH_INTERVAL:
+                flush()
+
+        def add(build: BuildInfo):
+            nonlocal batch_start
+            if not batch:
+                batch_start = monotonic()
+            batch.append(build)
+            if len(batch) >= BATCH_SIZE:
+                flush()
+            else:
+                flush_if_due()
+
+        completed: set[str] = set()
+        for source, item in merge_sources(
+            sources, SOURCE_TIMEOUTS, on_idle=flush_if_due, running=self.running_sources, completed=completed
+        ):
+            if source == "launcher":
+                self.new_bl_version.emit(item)
+            else:
+                add(item)
+
+        # Sources that timed out or failed show what they found last time instead
+        self.incomplete_sources = set(sources) - completed
+        for source in self.incomplete_sources:
+            for build in self.cached_builds(source):
+                add(build)
+
+        flush()
+
+    def cached_builds(self, source: str) -> list[BuildInfo]:
+        """The builds `source` found the last time it completed, taken while it may still be updating them."""
+        if source == "stable":
+            if self.cache is None:
+                return []
+            minimum_version = get_minimum_blender_stable_version()
+            return [
+                build
+                for ver, folder in list(self.cache.folders.items())
+                if ver >= minimum_version
+                for build in folder.assets
+            ]
+        if source == "automated":
+            return [build for builds in list(self.automated_cache.branches.values()) for build in builds]
+        return []
+
+    def scrape_launcher_version(self):
+        pre_release = get_use_pre_release_builds()
+        now = datetime.now(tz=timezone.utc)
+
+        cache = self.launcher_cache
+        if cache.is_fresh(pre_release, now, LAUNCHER_RECHECK_INTERVAL):
+            logger.debug(f"Using launcher version {cache.latest_tag} checked at {cache.checked_date}")
+            yield cache.latest_tag
+            return
+
+        if pre_release:
             url = "https://api.github.com/repos/Victor-IX/Blender-Launcher-V2/releases"
-            latest_tag = get_latest_pre_release_tag(self.manager, url)
+            latest_tag = get_latest_pre_release_tag(self.manager, url, cache)
         else:
             url = "https://github.com/Victor-IX/Blender-Launcher-V2/releases/latest"
             latest_tag = get_latest_tag(self.manager, url)
 
         if latest_tag is not None:
-            self.new_bl_version.emit(latest_tag)
-        self.manager.manager.clear()
+            cache.latest_tag = latest_tag
+            cache.pre_release = pre_release
+            cache.checked_date = now
+            if write_cache(self.launcher_cache_path, cache.to_dict()):
+                logger.debug(f"Saved cache to {self.launcher_cache_path}")
 
-    def get_download_links(self):
-        set_locale()
-
-        scrapers = []
-        if self.scrape_stable:
-            scrapers.append(self.scrap_stable_releases())
-        if self.scrape_automated:
-            scrapers.append(self.scrape_automated_releases())
-        for build in chain(*scrapers):
-            self.links.emit(build)
-
-        reset_locale()
+            yield latest_tag
 
     def scrape_automated_releases(self):
         base_fmt = "https://builder.blender.org/download/{}/?format=json&v=1"
+        cache_modified = False
         for branch_type in ("daily", "experimental", "patch"):
             url = base_fmt.format(branch_type)
-            r = self.manager.request("GET", url)
+            r = self.manager.request(
+                "GET",
+                url,
+                headers={"accept-encoding": "gzip"},
+                cache=True,
+                preload_content=False,
+            )
 
-            if r is None:
+            builds = None
+            if r is not None:
+                try:
+                    if r.status != 200:
+                        logger.error(f"Failed to scrape {branch_type} builds: {url} returned {r.status}")
+                    else:
+                        builds = [
+                            self.new_build_from_dict(build, branch_type)
+                            for build in read_json(r)
+                            if build["platform"] == self.json_platform and self.b3d_link.match(build["file_name"])
+                        ]
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.error(f"Failed to scrape {branch_type} builds: {url} returned an invalid listing: {e}")
+                finally:
+                    r.release_conn()
+
+            if builds is None:
+                # Keep showing the last known builds of this branch
+                yield from self.automated_cache.branches.get(branch_type, [])
                 continue
 
-            data = json.loads(r.data)
-            for build in data:
-                if build["platform"] == self.json_platform and self.b3d_link.match(build["file_name"]):
-                    yield self.new_build_from_dict(build, branch_type)
+            added, removed = self.automated_cache.update(branch_type, builds)
+            if added or removed:
+                logger.debug(f"{branch_type} builds changed: {len(added)} added, {len(removed)} removed")
+                cache_modified = True
+
+            for build in removed:
+                self.removed.emit(build)
+            yield from builds
+
+        if cache_modified and write_cache(self.automated_cache_path, self.automated_cache.to_dict()):
+            logging.debug(f"Saved cache to {self.automated_cache_path}")
 
     def new_build_from_dict(self, build, branch_type):
         dt = datetime.fromtimestamp(build["file_mtime"], tz=timezone.utc)
@@ -202,28 +473,24 @@ class Scraper(QThread):
             branch_type,
         )
 
-    def scrap_download_links(self, url, branch_type, _limit=None, stable=False):
-        r = self.manager.request("GET", url)
+    def scrap_download_entries(self, url, _limit=None) -> list[AutoindexEntry]:
+        r = self.manager.request("GET", url, preload_content=False)
 
         if r is None:
-            return
-
-        content = r.data
-
-        soup_stainer = SoupStrainer("a", href=True)
-        soup = BeautifulSoup(content, "lxml", parse_only=soup_stainer)
+            return []
 
-        for tag in soup.find_all(limit=_limit, href=self.b3d_link):
-            build_info = self.new_blender_build(tag, url, branch_type)
-
-            if build_info is not None:
-                yield build_info
+        entries = []
+        for entry in parse_autoindex(r.stream(LISTING_CHUNK_SIZE)):
+            if self.b3d_link.search(entry.href):
+                entries.append(entry)
+                if len(entries) == _limit:
+                    break
 
         r.release_conn()
         r.close()
+        return entries
 
-    def new_blender_build(self, tag, url, branch_type):
-        link = urljoin(url, tag["href"]).rstrip("/")
+    def request_last_modified(self, link) -> datetime | None:
         r = self.manager.request("HEAD", link)
 
         if r is None:
@@ -232,7 +499,23 @@ class Scraper(QThread):
         if r.status != 200:
             return None
 
-        info = r.headers
+        commit_time = parse_http_date(r.headers["last-modified"]).astimezone()
+
+        r.release_conn()
+        r.close()
+        return commit_time
+
+    def new_blender_build(self, entry: AutoindexEntry, url, branch_type):
+        link = urljoin(url, entry.href).rstrip("/")
+
+        # The listing row already has the date, only HEAD the file when it can't be read from there
+        commit_time = entry.date
+        if commit_time is None:
+            commit_time = self.request_last_modified(link)
+
+            if commit_time is None:
+                return None
+
         build_hash: str | None = None
         stem = Path(link).stem
         match = re.findall(self.hash, stem)
@@ -241,47 +524,38 @@ class Scraper(QThread):
             build_hash = match[-1].replace("-", "")
 
         subversion = parse_blender_ver(stem, search=True)
-        branch = branch_type
-        if branch_type != "stable":
-            build_var = ""
-            tag = tag.find_next("span", class_="build-var")
+        return BuildInfo(link, str(subversion), build_hash, commit_time, branch_type)
 
-            # For some reason tag can be None on macOS
-            if tag is not None:
-                build_var = tag.get_text()
-
-            if self.platform == "macOS":
-                if "arm64" in link:
-                    build_var = "{} │ {}".format(build_var, "Arm")
-                elif "x86_64" in link:
-                    build_var = "{} │ {}".format(build_var, "Intel")
-
-            if branch_type == "experimental":
-                branch = build_var
-            elif branch_type == "daily":
-                branch = "daily"
-                subversion = subversion.replace(prerelease=build_var)
+    def scrap_stable_releases(self):
+        start_time = perf_counter()
+        minimum_version = get_minimum_blender_stable_version()
 
-        commit_time = datetime.strptime(info["last-modified"], "%a, %d %b %Y %H:%M:%S %Z").astimezone()
+        if self.cache is None:
+            self.cache = StableCache.load(self.cache_path, minimum_version, self.legacy_cache_path)
+        else:
+            self.cache.materialize(minimum_version)
 
-        r.release_conn()
-        r.close()
-        return BuildInfo(link, str(subversion), build_hash, commit_time, branch)
+        # Stale-while-revalidate: show what the cache holds right away,
+        # then only report the folders that changed since
+        shown: set[Version] = set()
+        if get_show_cached_stable_builds_first():
+            for ver, folder in self.cache.folders.items():
+                if ver >= minimum_version:
+                    shown.add(ver)
+                    yield from folder.assets
 
-    def scrap_stable_releases(self):
         url = "https://download.blender.org/release/"
-        r = self.manager.request("GET", url)
+        r = self.manager.request("GET", url, cache=True)
 
         if r is None:
             return
 
         content = r.data
-        soup = BeautifulSoup(content, "lxml")
 
         b3d_link = re.compile(r"Blender\d+\.\d+")
         subversion = re.compile(r"\d+\.\d+")
 
-        releases = soup.find_all(href=b3d_link)
+        releases = [entry for entry in parse_autoindex((content,)) if b3d_link.search(entry.href)]
         if not any(releases):
             logger.info("Failed to gather stable releases")
             logger.info(content)
@@ -289,52 +563,81 @@ class Scraper(QThread):
                 "No releases were scraped from the site!<br>Using cached links.<br>check -debug logs for more details.<br>"
             )
             # Use cached links
-            for build in self.cache.folders.values():
-                yield from build.assets
+            for ver, build in self.cache.folders.items():
+                if ver not in shown:
+                    yield from build.assets
             return
 
-        minimum_version = get_minimum_blender_stable_version()
-        cache_modified = False
+        # (version, folder url, modified date) in the order of the release index
+        folders: list[tuple[Version, str, datetime | None]] = []
         for release in releases:
-            href = release["href"]
-            match = re.search(subversion, href)
+            match = re.search(subversion, release.href)
             if match is None:
                 continue
 
             ver = parse_blender_ver(match.group(0))
-            if ver >= minimum_version:
-                # Check modified dates of folders, if available
-                date_sibling = release.find_next_sibling(string=True)
-                if date_sibling:
-                    date_str = " ".join(date_sibling.strip().split()[:2])
-                    with contextlib.suppress(ValueError):
-                        modified_date = datetime.strptime(date_str, "%d-%b-%Y %H:%M").astimezone(tz=timezone.utc)
-                        if ver not in self.cache:
-                            logger.debug(f"Creating new folder for version {ver}")
-                            folder = self.cache.new_build(ver)
-                        else:
-                            folder = self.cache[ver]
-
-                        if folder.modified_date != modified_date:
-                            builds = list(self.scrap_download_links(urljoin(url, href), "stable", stable=True))
-                            logger.debug(f"Caching {href}: {modified_date} (previous was {folder.modified_date})")
-
-                            folder.assets = builds
-                            folder.modified_date = modified_date
-
-                            cache_modified = True
-                        else:
-                            logger.debug(f"Skipping {href}: {modified_date}")
-                        builds = self.cache[ver].assets
-                        yield from builds
-                        continue
-
-                yield from self.scrap_download_links(urljoin(url, href), "stable", stable=True)
-
-        if cache_modified:
-            with self.cache_path.open("w", encoding="utf-8") as f:
-                json.dump(self.cache.to_dict(), f)
-                logging.debug(f"Saved cache to {self.cache_path}")
+            if ver < minimum_version:
+                continue
+
+            # Modified dates of folders, if available, tell which ones changed
+            folders.append((ver, urljoin(url, release.href), release.date))
 
         r.release_conn()
         r.close()
+
+        outdated = [
+            (ver, folder_url)
+            for ver, folder_url, modified_date in folders
+            if not self.cache.is_fresh(ver, modified_date)
+        ]
+
+        # Fetch all outdated folder listings first, then probe every file they list,
+        # so that neither stage waits on the other within the bounded request pool
+        listings = self.manager.concurrent_map(lambda folder: self.scrap_download_entries(folder[1]), outdated)
+        probes = [(folder_url, entry) for (_, folder_url), entries in zip(outdated, listings) for entry in entries]
+        probed = iter(
+            self.manager.concurrent_map(lambda probe: self.new_blender_build(probe[1], probe[0], "stable"), probes)
+        )
+        scraped: dict[Version, list[BuildInfo]] = {}
+        for (ver, _), entries in zip(outdated, listings):
+            scraped[ver] = [build for build in (next(probed) for _ in entries) if build is not None]
+
+        cache_modified = False
+        for ver, folder_url, modified_date in folders:
+            if ver not in scraped:
+                logger.debug(f"Skipping {folder_url}: {modified_date}")
+                if ver not in shown:
+                    yield from self.cache[ver].assets
+                continue
+
+            builds = scraped[ver]
+            if ver in shown:
+                # Only the difference to what was shown from the cache changes the list
+                old_links = {build.link for build in self.cache[ver].assets}
+                new_links = {build.link for build in builds}
+                for build in self.cache[ver].assets:
+                    if build.link not in new_links:
+                        self.removed.emit(build)
+                yield from (build for build in builds if build.link not in old_links)
+            else:
+                yield from builds
+
+            if modified_date is not None:
+                if ver not in self.cache:
+                    logger.debug(f"Creating new folder for version {ver}")
+                    folder = self.cache.new_build(ver)
+                else:
+                    folder = self.cache[ver]
+
+                logger.debug(f"Caching {folder_url}: {modified_date} (previous was {folder.modified_date})")
+                folder.assets = builds
+                folder.modified_date = modified_date
+                cache_modified = True
+
+        if cache_modified and self.cache.save(self.cache_path):
+            logging.debug(f"Saved cache to {self.cache_path}")
+
+        logger.info(
+            f"Scraped stable releases in {perf_counter() - start_time:.2f}s "
+            f"({len(outdated)} of {len(folders)} folders fetched, {len(probes)} files listed)"
+        )
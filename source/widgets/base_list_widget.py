@@ -2,12 +2,17 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from modules.build_info import BuildIndex
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFontMetrics
 from PyQt5.QtWidgets import QAbstractItemView, QListWidget
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from items.base_list_widget_item import BaseListWidgetItem
     from modules.build_info import BuildInfo
+    from PyQt5.QtWidgets import QWidget
     from widgets.base_build_widget import BaseBuildWidget
     from widgets.base_page_widget import BasePageWidget
 
@@ -18,6 +23,7 @@ class BaseListWidget(QListWidget):
         self.parent: BasePageWidget | None = parent
 
         self.widgets = set()
+        self._build_index: BuildIndex[BaseBuildWidget] | None = None
         self.metrics = QFontMetrics(self.font())
 
         self.setFrameShape(QListWidget.NoFrame)
@@ -35,6 +41,20 @@ class BaseListWidget(QListWidget):
         self.setItemWidget(item, widget)
         self.count_changed()
         self.widgets.add(widget)
+        self._build_index = None
+
+    def add_items(self, items: Iterable[tuple[BaseListWidgetItem, QWidget]]):
+        """Adds several rows at once, sorting the list and updating its placeholder only once."""
+        self.setSortingEnabled(False)
+        for item, widget in items:
+            item.setSizeHint(widget.sizeHint())
+            self.addItem(item)
+            self.setItemWidget(item, widget)
+            self.widgets.add(widget)
+        self._build_index = None
+        self.setSortingEnabled(True)
+        self.sortItems()
+        self.count_changed()
 
     def insert_item(self, item, widget, index=0):
         item.setSizeHint(widget.sizeHint())
@@ -42,9 +62,11 @@ class BaseListWidget(QListWidget):
         self.setItemWidget(item, widget)
         self.count_changed()
         self.widgets.add(widget)
+        self._build_index = None
 
     def remove_item(self, item):
         self.widgets.remove(self.itemWidget(item))
+        self._build_index = None
         row = self.row(item)
         self.takeItem(row)
         self.count_changed()
@@ -68,16 +90,28 @@ class BaseListWidget(QListWidget):
 
         return items
 
+    def build_index(self) -> BuildIndex[BaseBuildWidget]:
+        """Index of the widgets by their build, built again once rows or their builds change"""
+        if self._build_index is None:
+            index: BuildIndex[BaseBuildWidget] = BuildIndex()
+            for widget in self.widgets:
+                build_info = getattr(widget, "build_info", None)
+                if build_info is not None:
+                    index.add(build_info, widget)
+            self._build_index = index
+        return self._build_index
+
+    def build_info_changed(self):
+        self._build_index = None
+
     def contains_build_info(self, build_info):
-        return any(build_info == widget.build_info for widget in self.widgets)
+        return build_info in self.build_index()
 
     def widget_with_blinfo(self, build_info: BuildInfo) -> BaseBuildWidget | None:
-        try:
-            return next(widget for widget in self.widgets if build_info == widget.build_info)
-        except StopIteration:
-            return None
+        return self.build_index().get(build_info)
 
     def clear_(self):
         self.clear()
         self.widgets.clear()
+        self._build_index = None
         self.count_changed()
@@ -48,6 +48,7 @@ class DownloadWidget(BaseBuildWidget):
         self.state = DownloadState.IDLE
         self.build_dir = None
         self.source_file = None
+        self.paused_folder: Path | None = None
 
         self.progressBar = BaseProgressBarWidget()
         self.progressBar.setFont(self.parent.font_8)
@@ -204,6 +205,7 @@ class DownloadWidget(BaseBuildWidget):
             dist = library_folder / "experimental"
 
         self.source_file = source
+        self.pause_library_folder(dist)
         a = ExtractTask(file=source, destination=dist)
         a.progress.connect(self.progressBar.set_progress)
         a.finished.connect(self.init_template_installer)
@@ -260,7 +262,7 @@ class DownloadWidget(BaseBuildWidget):
             archive_name=archive_name,
         )
         a.finished.connect(self.download_rename)
-        a.failure.connect(lambda: print("Reading failed"))
+        a.failure.connect(lambda: (print("Reading failed"), self.resume_library_folder()))
         self.parent.task_queue.append(a)
 
     def download_rename(self, build_info: BuildInfo):
@@ -272,7 +274,7 @@ class DownloadWidget(BaseBuildWidget):
             dst_name=new_name,
         )
         t.finished.connect(self.download_finished)
-        t.failure.connect(lambda: print("Renaming failed"))
+        t.failure.connect(lambda: (print("Renaming failed"), self.resume_library_folder()))
         self.parent.task_queue.append(t)
 
     def download_finished(self, path):
@@ -294,6 +296,19 @@ class DownloadWidget(BaseBuildWidget):
             )
             self.setInstalled(widget)
 
+        self.resume_library_folder()
+
+    def pause_library_folder(self, folder: Path):
+        """Keeps the library observer from reporting the build before it is extracted, read and renamed"""
+        self.resume_library_folder()
+        self.parent.paused_library_folders.pause(folder)
+        self.paused_folder = folder
+
+    def resume_library_folder(self):
+        if self.paused_folder is not None:
+            self.parent.paused_library_folders.resume(self.paused_folder)
+            self.paused_folder = None
+
     def setInstalled(self, build_widget: BaseBuildWidget):
         if self.state == DownloadState.IDLE:
             build_widget.destroyed.connect(self.uninstalled)
@@ -60,7 +60,7 @@ class UnrecoBuildWidget(BaseBuildWidget):
 
     @pyqtSlot(BuildInfo)
     def new_build(self, binfo: BuildInfo):
-        binfo.write_to(self.path)
+        self.parent.build_info_writer.write_now(self.path, binfo)
         self.parent.draw_to_library(self.path, True)
         self.destroy()
 
@@ -10,7 +10,7 @@ from typing import TYPE_CHECKING
 
 from items.base_list_widget_item import BaseListWidgetItem
 from modules._platform import _call, _popen, get_platform
-from modules.build_info import BuildInfo, ReadBuildTask, WriteBuildTask
+from modules.build_info import BuildInfo, ReadBuildTask
 from modules.settings import (
     get_bash_arguments,
     get_blender_startup_arguments,
@@ -61,6 +61,7 @@ class LibraryWidget(BaseBuildWidget):
         list_widget,
         show_new=False,
         parent_widget=None,
+        build_info: BuildInfo | None = None,
     ):
         super().__init__(parent=parent)
         self.setAcceptDrops(True)
@@ -109,11 +110,15 @@ class LibraryWidget(BaseBuildWidget):
             self.layout.addWidget(self.launchButton)
             self.layout.addWidget(self.infoLabel, stretch=1)
 
-            a = ReadBuildTask(link)
-            a.finished.connect(self.draw)
-            a.failure.connect(self.trigger_damaged)
+            if build_info is not None:
+                # Already known from the library index
+                self.draw(build_info)
+            else:
+                a = ReadBuildTask(link)
+                a.finished.connect(self.draw)
+                a.failure.connect(self.trigger_damaged)
 
-            self.parent.task_queue.append(a)
+                self.parent.task_queue.append(a)
 
         else:
             self.draw(self.parent_widget.build_info)
@@ -132,8 +137,9 @@ class LibraryWidget(BaseBuildWidget):
                 self.layout.itemAt(i).widget().setParent(None)
 
         self.build_info = build_info
+        self.list_widget.build_info_changed()
         self.branch = self.build_info.branch
-        self.item.date = build_info.commit_time
+        self.item.set_build_info(build_info)
 
         self.launchButton = LeftIconButtonWidget("Launch", parent=self)
         self.launchButton.setFixedWidth(85)
@@ -295,7 +301,9 @@ class LibraryWidget(BaseBuildWidget):
             self.add_to_quick_launch()
 
         self.setEnabled(True)
-        self.list_widget.sortItems()
+        # Rows drawn before being added to their list are sorted once the whole batch is added
+        if self.item.listWidget() is not None:
+            self.list_widget.sortItems()
 
         if self.build_info.is_favorite and self.parent_widget is None:
             self.add_to_favorites()
@@ -553,15 +561,7 @@ class LibraryWidget(BaseBuildWidget):
 
     def write_build_info(self):
         assert self.build_info is not None
-        self.build_info_writer = WriteBuildTask(
-            self.link,
-            self.build_info,
-        )
-        self.build_info_writer.written.connect(self.build_info_writer_finished)
-        self.parent.task_queue.append(self.build_info_writer)
-
-    def build_info_writer_finished(self):
-        self.build_info_writer = None
+        self.parent.build_info_writer.schedule(self.link, self.build_info)
 
     @QtCore.pyqtSlot()
     def ask_remove_from_drive(self):
@@ -631,7 +631,7 @@ class LibraryWidget(BaseBuildWidget):
     @QtCore.pyqtSlot(BuildInfo)
     def build_info_edited(self, blinfo: BuildInfo):
         self.list_widget.remove_item(self.item)
-        blinfo.write_to(Path(blinfo.link))
+        self.parent.build_info_writer.write_now(Path(blinfo.link), blinfo)
         self.parent.draw_to_library(Path(blinfo.link), show_new=True)
 
     @QtCore.pyqtSlot()
@@ -695,8 +695,7 @@ class LibraryWidget(BaseBuildWidget):
 
         assert self.build_info is not None
         self.build_info.is_favorite = False
-        self.build_info_writer = WriteBuildTask(self.link, self.build_info)
-        self.parent.task_queue.append(self.build_info_writer)
+        self.write_build_info()
 
     @QtCore.pyqtSlot()
     def register_extension(self):
@@ -14,6 +14,7 @@ from modules.settings import (
     get_quick_launch_key_seq,
     get_scrape_automated_builds,
     get_scrape_stable_builds,
+    get_show_cached_stable_builds_first,
     set_bash_arguments,
     set_blender_startup_arguments,
     set_check_for_new_builds_automatically,
@@ -27,6 +28,7 @@ from modules.settings import (
     set_quick_launch_key_seq,
     set_scrape_automated_builds,
     set_scrape_stable_builds,
+    set_show_cached_stable_builds_first,
 )
 from PyQt5 import QtGui
 from PyQt5.QtCore import Qt
@@ -88,6 +90,10 @@ class BlenderBuildsTabWidget(SettingsFormWidget):
         self.ScrapeAutomatedBuilds.setChecked(get_scrape_automated_builds())
         self.ScrapeAutomatedBuilds.clicked.connect(self.toggle_scrape_automated_builds)
         self.ScrapeAutomatedBuilds.setText("Scrape automated builds (daily/experimental/patch)")
+        self.ShowCachedStableBuildsFirst = QCheckBox(self)
+        self.ShowCachedStableBuildsFirst.setChecked(get_show_cached_stable_builds_first())
+        self.ShowCachedStableBuildsFirst.clicked.connect(self.toggle_show_cached_stable_builds_first)
+        self.ShowCachedStableBuildsFirst.setText("Show cached stable builds while checking for new ones")
 
         self.scraping_builds_layout = QGridLayout()
         self.scraping_builds_layout.addWidget(self.CheckForNewBuildsAutomatically, 0, 0, 1, 1)
@@ -97,6 +103,7 @@ class BlenderBuildsTabWidget(SettingsFormWidget):
         self.scraping_builds_layout.addWidget(self.MinStableBlenderVer, 2, 1, 1, 1)
         self.scraping_builds_layout.addWidget(self.ScrapeStableBuilds, 3, 0, 1, 2)
         self.scraping_builds_layout.addWidget(self.ScrapeAutomatedBuilds, 4, 0, 1, 2)
+        self.scraping_builds_layout.addWidget(self.ShowCachedStableBuildsFirst, 5, 0, 1, 2)
         self.buildcheck_settings.setLayout(self.scraping_builds_layout)
 
         # Downloading builds settings
@@ -252,6 +259,10 @@ class BlenderBuildsTabWidget(SettingsFormWidget):
         set_scrape_stable_builds(is_checked)
         self.ScrapeStableBuilds.setChecked(is_checked)
 
+    def toggle_show_cached_stable_builds_first(self, is_checked):
+        set_show_cached_stable_builds_first(is_checked)
+        self.ShowCachedStableBuildsFirst.setChecked(is_checked)
+
     def toggle_scrape_automated_builds(self, is_checked):
         set_scrape_automated_builds(is_checked)
         self.ScrapeAutomatedBuilds.setChecked(is_checked)
@@ -17,6 +17,7 @@ from typing import TYPE_CHECKING
 
 from items.base_list_widget_item import BaseListWidgetItem
 from modules._platform import _popen, get_cwd, get_launcher_name, get_platform, is_frozen
+from modules.build_info import ReadBuildTask
 from modules.connection_manager import ConnectionManager
 from modules.enums import MessageType
 from modules.settings import (
@@ -55,6 +56,7 @@ from PyQt5.QtWidgets import (
     QApplication,
     QHBoxLayout,
     QLabel,
+    QProgressBar,
     QPushButton,
     QStatusBar,
     QSystemTrayIcon,
@@ -63,7 +65,10 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 from semver import Version
+from threads.build_info_writer import BuildInfoWriter
+from threads.folder_observer import FolderObserver, PausedFolders
 from threads.library_drawer import DrawLibraryTask
+from threads.library_migrator import MigrateLibraryTask
 from threads.remover import RemovalTask
 from threads.scraper import Scraper
 from widgets.base_menu_widget import BaseMenuWidget
@@ -136,6 +141,7 @@ class BlenderLauncher(BaseWindow):
         )
         self.task_queue.start()
         self.quit_signal.connect(self.task_queue.fullstop)
+        self.build_info_writer = BuildInfoWriter(self.task_queue, parent=self)
 
         # Global scope
         self.app = app
@@ -145,7 +151,7 @@ class BlenderLauncher(BaseWindow):
         self.status = "Unknown"
         self.is_force_check_on = False
         self.app_state = AppState.IDLE
-        self.cashed_builds = []
+        self.cashed_builds: set[BuildInfo] = set()
         self.notification_pool = []
         self.windows = [self]
         self.timer = None
@@ -155,7 +161,11 @@ class BlenderLauncher(BaseWindow):
         self.platform = get_platform()
         self.settings_window = None
         self.hk_listener = None
+        self.library_observer: FolderObserver | None = None
+        # Branch folders downloads are being extracted into, the observer leaves them to the download
+        self.paused_library_folders = PausedFolders()
         self.last_time_checked = get_last_time_checked_utc()
+        self.last_check_metrics: tuple[float, int] | None = None
 
         if self.platform == "macOS":
             self.app.aboutToQuit.connect(self._aboutToQuit)
@@ -166,10 +176,12 @@ class BlenderLauncher(BaseWindow):
 
         # Setup scraper
         self.scraper = Scraper(self, self.cm)
-        self.scraper.links.connect(self.draw_to_downloads)
+        self.scraper.links.connect(self.draw_batch_to_downloads)
+        self.scraper.removed.connect(self.remove_from_downloads)
         self.scraper.error.connect(self.connection_error)
         self.scraper.stable_error.connect(self.scraper_error)
         self.scraper.new_bl_version.connect(self.set_version)
+        self.scraper.check_metrics.connect(self.set_check_metrics)
         self.scraper.finished.connect(self.scraper_finished)
 
         # Vesrion Update
@@ -378,6 +390,9 @@ class BlenderLauncher(BaseWindow):
         self.NewVersionButton = QPushButton()
         self.NewVersionButton.hide()
         self.NewVersionButton.clicked.connect(self.show_update_window)
+        self.MigrationProgressBar = QProgressBar()
+        self.MigrationProgressBar.setFormat("Updating build information: %v of %m")
+        self.MigrationProgressBar.hide()
         self.statusbarVersion = QPushButton(str(self.version))
         self.statusbarVersion.clicked.connect(self.show_changelog)
         self.statusbarVersion.setToolTip(
@@ -386,6 +401,7 @@ class BlenderLauncher(BaseWindow):
         self.status_bar.addPermanentWidget(self.ForceCheckNewBuilds)
         self.status_bar.addPermanentWidget(QLabel("│"))
         self.status_bar.addPermanentWidget(self.statusbarLabel)
+        self.status_bar.addPermanentWidget(self.MigrationProgressBar)
         self.status_bar.addPermanentWidget(QLabel(""), 1)
         self.status_bar.addPermanentWidget(self.NewVersionButton)
         self.status_bar.addPermanentWidget(self.statusbarVersion)
@@ -685,11 +701,15 @@ class BlenderLauncher(BaseWindow):
         return False
 
     def destroy(self):
+        self.build_info_writer.close()
         self.quit_signal.emit()
 
         if self.timer is not None:
             self.timer.cancel()
 
+        if self.library_observer is not None:
+            self.library_observer.stop()
+
         self.tray_icon.hide()
         self.app.quit()
 
@@ -713,28 +733,53 @@ class BlenderLauncher(BaseWindow):
 
         self.favorite = None
 
+        # Restarted once the library is drawn again, so that it doesn't add rows to the lists being redrawn
+        self.stop_library_observer()
+
         self.LibraryStableListWidget.clear_()
         self.LibraryDailyListWidget.clear_()
         self.LibraryExperimentalListWidget.clear_()
         self.UserCustomListWidget.clear_()
 
         self.library_drawer = DrawLibraryTask()
-        self.library_drawer.found.connect(self.draw_to_library)
-        self.library_drawer.unrecognized.connect(self.draw_unrecognized)
+        self.library_drawer.found.connect(self.draw_batch_to_library)
+        self.library_drawer.unrecognized.connect(self.draw_batch_unrecognized)
+        self.library_drawer.finished.connect(self.start_library_observer)
         if not self.offline:
             self.library_drawer.finished.connect(self.draw_downloads)
 
+        # Outdated .blinfo files are upgraded all at once before the builds are read one by one
+        self.library_migrator = MigrateLibraryTask()
+        self.library_migrator.progress.connect(self.set_migration_progress)
+        self.library_migrator.finished.connect(self.library_migrated)
+        self.task_queue.append(self.library_migrator)
+
+    @pyqtSlot(int, int)
+    def set_migration_progress(self, done: int, total: int):
+        self.MigrationProgressBar.setMaximum(total)
+        self.MigrationProgressBar.setValue(done)
+        self.MigrationProgressBar.show()
+
+    @pyqtSlot()
+    def library_migrated(self):
+        self.MigrationProgressBar.hide()
         self.task_queue.append(self.library_drawer)
 
     def reload_custom_builds(self):
+        self.stop_library_observer()
         self.UserCustomListWidget.clear_()
 
         self.library_drawer = DrawLibraryTask(["custom"])
-        self.library_drawer.found.connect(self.draw_to_library)
-        self.library_drawer.unrecognized.connect(self.draw_unrecognized)
+        self.library_drawer.found.connect(self.draw_batch_to_library)
+        self.library_drawer.unrecognized.connect(self.draw_batch_unrecognized)
+        self.library_drawer.finished.connect(self.start_library_observer)
         self.task_queue.append(self.library_drawer)
 
     def draw_downloads(self):
+        # Show the builds known from the previous check until the scraper answers
+        if get_scrape_automated_builds():
+            self.draw_batch_to_downloads(list(self.scraper.automated_cache.builds()))
+
         if get_check_for_new_builds_on_startup():
             self.start_scraper()
         else:
@@ -786,11 +831,6 @@ class BlenderLauncher(BaseWindow):
             if page is not self.DownloadsStablePageWidget:
                 page.set_info_label_text(msg)
 
-        # Sometimes these builds end up being invalid, particularly when new builds are available, which, there usually
-        # are at least once every two days. They are so easily gathered there's little loss here
-        self.DownloadsDailyListWidget.clear_()
-        self.DownloadsExperimentalListWidget.clear_()
-
         self.cashed_builds.clear()
         self.new_downloads = False
         self.app_state = AppState.CHECKINGBUILDS
@@ -805,9 +845,14 @@ class BlenderLauncher(BaseWindow):
             self.show_message("New builds of Blender are available!", message_type=MessageType.NEWBUILDS)
 
         for list_widget in self.DownloadsToolBox.list_widgets:
+            # Rows of a source that timed out or failed weren't checked again, keep them
+            source = "stable" if list_widget is self.DownloadsStableListWidget else "automated"
+            if source in self.scraper.incomplete_sources:
+                continue
+
             for widget in list_widget.widgets.copy():
-                if widget.build_info not in self.cashed_builds:
-                    widget.destroy()
+                if widget.build_info not in self.cashed_builds and widget.state == DownloadState.IDLE:
+                    list_widget.remove_item(widget.item)
 
         utcnow = localtime()
         dt = datetime.fromtimestamp(mktime(utcnow)).astimezone()
@@ -826,54 +871,119 @@ class BlenderLauncher(BaseWindow):
         self.app_state = AppState.IDLE
         self.set_status("Last check at " + self.last_time_checked.strftime(DATETIME_FORMAT), True)
 
+        if self.last_check_metrics is not None:
+            duration, requests = self.last_check_metrics
+            self.statusbarLabel.setToolTip(f"Last check took {duration:.1f}s and {requests} requests")
+
+    @pyqtSlot(float, int)
+    def set_check_metrics(self, duration: float, requests: int):
+        self.last_check_metrics = (duration, requests)
+
     def draw_from_cashed(self, build_info):
+        # Builds that were never read have nothing to match against
+        if build_info is None:
+            return
+
         if self.app_state == AppState.IDLE:
             for cashed_build in self.cashed_builds:
-                if build_info == cashed_build:
+                if build_info.matches(cashed_build):
                     self.draw_to_downloads(cashed_build, False)
                     return
 
     def draw_to_downloads(self, build_info: BuildInfo, show_new=True):
-        if self.started:
-            show_new = False
-        else:
-            show_new = True
+        self.draw_batch_to_downloads([build_info])
 
-        if build_info.commit_time > self.last_time_checked:
-            show_new = True
+    @pyqtSlot(list)
+    def draw_batch_to_downloads(self, builds: list[BuildInfo]):
+        show_new = not self.started
 
-        if build_info not in self.cashed_builds:
-            self.cashed_builds.append(build_info)
+        # Rows are collected per list first, then inserted and sorted once per list
+        new_rows: dict[BaseListWidget, list[tuple[BaseListWidgetItem, DownloadWidget]]] = {}
+        drawn: set[BuildInfo] = set()
 
-        branch = build_info.branch
+        for build_info in builds:
+            self.cashed_builds.add(build_info)
 
-        if branch in ("stable", "lts"):
-            downloads_list_widget = self.DownloadsStableListWidget
-            library_list_widget = self.LibraryStableListWidget
-        elif branch == "daily":
-            downloads_list_widget = self.DownloadsDailyListWidget
-            library_list_widget = self.LibraryDailyListWidget
-        else:
-            downloads_list_widget = self.DownloadsExperimentalListWidget
-            library_list_widget = self.LibraryExperimentalListWidget
+            branch = build_info.branch
+
+            if branch in ("stable", "lts"):
+                downloads_list_widget = self.DownloadsStableListWidget
+                library_list_widget = self.LibraryStableListWidget
+            elif branch == "daily":
+                downloads_list_widget = self.DownloadsDailyListWidget
+                library_list_widget = self.LibraryDailyListWidget
+            else:
+                downloads_list_widget = self.DownloadsExperimentalListWidget
+                library_list_widget = self.LibraryExperimentalListWidget
 
-        if not downloads_list_widget.contains_build_info(build_info):
+            rows = new_rows.setdefault(downloads_list_widget, [])
+            if downloads_list_widget.contains_build_info(build_info) or build_info in drawn:
+                continue
+            drawn.add(build_info)
+
+            is_new = show_new or build_info.commit_time > self.last_time_checked
             installed = library_list_widget.widget_with_blinfo(build_info)
-            item = BaseListWidgetItem(build_info.commit_time)
+            item = BaseListWidgetItem(build_info)
             widget = DownloadWidget(
                 self,
                 downloads_list_widget,
                 item,
                 build_info,
                 installed=installed,
-                show_new=show_new,
+                show_new=is_new,
             )
             widget.focus_installed_widget.connect(self.focus_widget)
-            downloads_list_widget.add_item(item, widget)
-            if show_new:
+            rows.append((item, widget))
+            if is_new:
                 self.new_downloads = True
 
+        for list_widget, rows in new_rows.items():
+            if rows:
+                list_widget.add_items(rows)
+
+    def remove_from_downloads(self, build_info: BuildInfo):
+        branch = build_info.branch
+
+        if branch in ("stable", "lts"):
+            downloads_list_widget = self.DownloadsStableListWidget
+        elif branch == "daily":
+            downloads_list_widget = self.DownloadsDailyListWidget
+        else:
+            downloads_list_widget = self.DownloadsExperimentalListWidget
+
+        for widget in downloads_list_widget.widgets.copy():
+            if widget.build_info.link == build_info.link and widget.state == DownloadState.IDLE:
+                downloads_list_widget.remove_item(widget.item)
+
+    def draw_batch_to_library(self, builds: list[tuple[Path, BuildInfo | None]]):
+        """Draws a batch of DrawLibraryTask, sorting every list once for the whole batch."""
+        rows: dict[BaseListWidget, list[tuple[BaseListWidgetItem, LibraryWidget]]] = {}
+        for path, build_info in builds:
+            row = self.make_library_row(path, build_info=build_info)
+            if row is not None:
+                library, item, widget = row
+                rows.setdefault(library, []).append((item, widget))
+
+        for library, library_rows in rows.items():
+            library.add_items(library_rows)
+
     def draw_to_library(self, path: Path, show_new=False):
+        # The library observer might have drawn it already
+        existing = self.library_widget_at(path)
+        if isinstance(existing, LibraryWidget):
+            return existing
+        if isinstance(existing, UnrecoBuildWidget):
+            existing.destroy()
+
+        row = self.make_library_row(path, show_new)
+        if row is None:
+            return None
+
+        library, item, widget = row
+        library.insert_item(item, widget)
+        return widget
+
+    def make_library_row(self, path: Path, show_new=False, build_info: BuildInfo | None = None):
         branch = Path(path).parent.name
 
         if branch in ("stable", "lts"):
@@ -892,7 +1002,7 @@ class BlenderLauncher(BaseWindow):
             return None
 
         item = BaseListWidgetItem()
-        widget = LibraryWidget(self, item, path, library, show_new)
+        widget = LibraryWidget(self, item, path, library, show_new, build_info=build_info)
 
         if download is not None:
 
@@ -901,10 +1011,108 @@ class BlenderLauncher(BaseWindow):
                 if dlw is not None and not dlw.installed:
                     dlw.setInstalled(widget)
 
-            widget.initialized.connect(_initialized)
+            if widget.build_info is None:
+                widget.initialized.connect(_initialized)
+            else:
+                _initialized()
 
-        library.insert_item(item, widget)
-        return widget
+        return library, item, widget
+
+    def library_widget_at(self, path: Path) -> BaseBuildWidget | None:
+        for list_widget in (
+            self.LibraryStableListWidget,
+            self.LibraryDailyListWidget,
+            self.LibraryExperimentalListWidget,
+            self.UserCustomListWidget,
+        ):
+            for widget in list_widget.widgets:
+                link = widget.path if isinstance(widget, UnrecoBuildWidget) else getattr(widget, "link", None)
+                if link is not None and Path(link) == path:
+                    return widget
+        return None
+
+    @pyqtSlot()
+    def start_library_observer(self):
+        self.stop_library_observer()
+
+        self.library_observer = FolderObserver(Path(get_library_folder()), paused=self.paused_library_folders)
+        self.library_observer.found.connect(self.library_build_found)
+        self.library_observer.unrecognized.connect(self.library_build_unrecognized)
+        self.library_observer.removed.connect(self.library_build_removed)
+        self.library_observer.start()
+
+    def stop_library_observer(self):
+        if self.library_observer is not None:
+            self.library_observer.stop()
+            self.library_observer.wait()
+            # Reports it queued before stopping are ignored from now on
+            self.library_observer = None
+
+    @pyqtSlot(Path)
+    def library_build_found(self, path: Path):
+        """A build was added or its .blinfo edited outside of the launcher."""
+        if self.library_observer is None:
+            return
+
+        widget = self.library_widget_at(path)
+
+        if isinstance(widget, UnrecoBuildWidget):
+            widget.destroy()
+            widget = None
+
+        if widget is None:
+            self.draw_to_library(path, show_new=True)
+            return
+
+        if not isinstance(widget, LibraryWidget) or widget.build_info is None:
+            # Still being read
+            return
+
+        def reread(build_info: BuildInfo):
+            if widget.build_info is not None and build_info.to_dict() != widget.build_info.to_dict():
+                self.redraw_library_build(widget, build_info)
+
+        a = ReadBuildTask(path)
+        a.finished.connect(reread)
+        self.task_queue.append(a)
+
+    @pyqtSlot(Path)
+    def library_build_unrecognized(self, path: Path):
+        """A folder that isn't a build was added to the library outside of the launcher."""
+        if self.library_observer is None or self.library_widget_at(path) is not None:
+            return
+
+        self.draw_unrecognized(path)
+
+    @pyqtSlot(Path)
+    def library_build_removed(self, path: Path):
+        """A build was removed outside of the launcher."""
+        if self.library_observer is None:
+            return
+
+        widget = self.library_widget_at(path)
+        if widget is None or path.exists():
+            return
+
+        if isinstance(widget, LibraryWidget):
+            widget.remover_completed(0)
+        else:
+            widget.list_widget.remove_item(widget.item)
+
+    def redraw_library_build(self, widget: LibraryWidget, build_info: BuildInfo):
+        if widget.child_widget is not None:
+            self.UserFavoritesListWidget.remove_item(widget.child_widget.item)
+            widget.child_widget = None
+        widget.list_widget.remove_item(widget.item)
+
+        row = self.make_library_row(Path(widget.link), build_info=build_info)
+        if row is not None:
+            library, item, new_widget = row
+            library.insert_item(item, new_widget)
+
+    def draw_batch_unrecognized(self, paths: list[Path]):
+        for path in paths:
+            self.draw_unrecognized(path)
 
     def draw_unrecognized(self, path):
         branch = Path(path).parent.name